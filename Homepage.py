@@ -1,7 +1,8 @@
 # app.py
 import streamlit as st
-from utils import render_chatbot, t
-import requests
+from utils import render_chatbot, t, lang_code_map
+from prefetch import prefetch_topic
+import http_cache
 
 st.set_page_config(
     page_title="WikiVerse Pro",
@@ -12,6 +13,7 @@ st.set_page_config(
 render_chatbot()  # Sidebar chatbot
 
 #change0
+# These labels are translation.UI_STRINGS, served from the compiled catalog
 st.title(t("🌐 WikiVerse Pro"))
 st.markdown(f"#### {t('Explore. Learn. Connect.')}")
 language = st.selectbox(t("Choose language for results"), ["English", "Hindi", "Telugu", "Tamil", "Kannada"])
@@ -26,6 +28,7 @@ if st.button("Explore"):
         # Redirect to first page (you will handle topic routing via session_state)
         st.session_state["selected_topic"] = topic
         st.session_state["language"] = language
+        prefetch_topic(topic, lang_code_map.get(language, "en"))
         st.switch_page("pages/1_Basic_Info.py")  # Streamlit 1.25+ feature
     else:
         st.warning("Please enter a topic to explore.")
@@ -40,9 +43,7 @@ def get_translated_topic_title(topic, lang="en"):
             "namespace": 0,
             "format": "json"
         }
-        response = requests.get(search_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = http_cache.get_json(search_url, params=params)
         return data[1][0] if data[1] else topic
     except:
         return topic
\ No newline at end of file
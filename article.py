@@ -0,0 +1,143 @@
+# article.py
+import html as html_lib
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import quote
+
+import streamlit as st
+
+import http_cache
+from html_text import html_to_text
+
+# Matches the start of every section heading in `action=parse` output, both the
+# newer `<div class="mw-heading mw-heading2"><h2 id="...">` markup and the older
+# `<h2><span class="mw-headline" id="...">`, capturing the level and the id.
+HEADING_RE = re.compile(
+    r'(?:<div class="mw-heading[^"]*">\s*)?<h([2-6])\b([^>]*)>(?:\s*<span[^>]*?\bid=["\']([^"\']*)["\'])?',
+    re.IGNORECASE,
+)
+ID_ATTR_RE = re.compile(r'\bid=["\']([^"\']*)["\']')
+
+
+@dataclass
+class Article:
+    """Everything the pages need about one Wikipedia topic, fetched once."""
+    title: str
+    lang: str = "en"
+    exists: bool = False
+    revid: Optional[int] = None
+    summary: str = ""
+    thumbnail: Optional[str] = None
+    sections: list = field(default_factory=list)
+    section_html: dict = field(default_factory=dict)
+    categories: list = field(default_factory=list)
+
+    def top_sections(self, max_level=2):
+        return [s for s in self.sections if int(s["toclevel"]) <= max_level]
+
+    def find_sections(self, *words):
+        return [s for s in self.sections if any(w in s["line"].lower() for w in words)]
+
+    def section(self, index):
+        return next((s for s in self.sections if str(s["index"]) == str(index)), None)
+
+    def section_text(self, index):
+        return html_to_text(self.section_html.get(str(index), ""))
+
+
+def _get_json(url, params=None, timeout=10):
+    return http_cache.get_json(url, params=params, timeout=timeout)
+
+
+def split_sections(html, sections):
+    """Cut the full page HTML into per-section chunks keyed by section index.
+
+    Like `action=parse&section=N`, a section's chunk includes its subsections.
+    Index "0" is the lead. Headings are matched to sections by id/anchor, not
+    by position, so a heading with no section entry (such as an injected
+    table of contents) can't shift every later section by one.
+    """
+    by_anchor = {s.get("anchor"): s for s in sections if s.get("anchor")}
+    starts = []
+    for m in HEADING_RE.finditer(html):
+        attr_id = ID_ATTR_RE.search(m.group(2))
+        anchor = html_lib.unescape(attr_id.group(1) if attr_id else (m.group(3) or ""))
+        starts.append((m.start(), int(m.group(1)), by_anchor.get(anchor)))
+    chunks = {"0": html[:starts[0][0]] if starts else html}
+
+    for i, (start, level, section) in enumerate(starts):
+        if section is None:
+            continue
+        end = len(html)
+        for next_start, next_level, _ in starts[i + 1:]:
+            if next_level <= level:
+                end = next_start
+                break
+        chunks[str(section["index"])] = html[start:end]
+    return chunks
+
+
+def fetch_article(title, lang="en"):
+    article = Article(title=title, lang=lang)
+    base = f"https://{lang}.wikipedia.org"
+
+    failures = []
+
+    # 1) REST summary: clean extract + thumbnail
+    try:
+        data = _get_json(f"{base}/api/rest_v1/page/summary/{quote(title.replace(' ', '_'), safe='')}")
+        article.exists = True
+        article.title = data.get("title", title)
+        article.summary = data.get("extract", "")
+        article.thumbnail = data.get("thumbnail", {}).get("source")
+    except Exception as e:
+        print(f"[Article] summary fetch failed for {title!r}: {e}")
+        failures.append(e)
+
+    # 2) One parse call for the section tree, all section HTML and categories
+    try:
+        data = _get_json(f"{base}/w/api.php", params={
+            "action": "parse",
+            "page": title,
+            "prop": "text|sections|categories",
+            "redirects": 1,
+            "disableeditsection": 1,
+            "disabletoc": 1,
+            "format": "json",
+            "formatversion": 2,
+        })
+        parsed = data.get("parse")
+        if parsed:
+            article.exists = True
+            article.revid = parsed.get("revid")
+            article.sections = parsed.get("sections", [])
+            article.section_html = split_sections(parsed.get("text", ""), article.sections)
+            article.categories = [
+                c["category"].replace("_", " ")
+                for c in parsed.get("categories", [])
+                if not c.get("hidden")
+            ]
+    except Exception as e:
+        print(f"[Article] parse fetch failed for {title!r}: {e}")
+        failures.append(e)
+
+    # Nothing came back at all: raise, so load_article doesn't cache an empty
+    # Article and make the topic look nonexistent until the TTL runs out
+    if len(failures) == 2:
+        raise failures[-1]
+    return article
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_article(title, lang="en"):
+    return fetch_article(title, lang)
+
+
+def load_article_or_empty(title, lang="en"):
+    """load_article for page rendering: an unreachable Wikipedia gives an empty, uncached Article."""
+    try:
+        return load_article(title, lang)
+    except Exception as e:
+        print(f"[Article] {title!r} unavailable: {e}")
+        return Article(title=title, lang=lang)
@@ -0,0 +1,129 @@
+"""Microbenchmark: Wikipedia section HTML -> text.
+
+Compares the old per-section pipeline (BeautifulSoup html.parser + four
+uncompiled re.sub passes) with html_text.html_to_text on every installed
+parser backend, over recorded `action=parse` responses in benchmarks/data/.
+
+    python benchmarks/bench_html_text.py --record "World War II" "History of India"
+    python benchmarks/bench_html_text.py
+
+Without recordings a synthetic article of similar shape is generated.
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import html_text  # noqa: E402
+
+DATA_DIR = os.path.join(ROOT, "benchmarks", "data")
+
+
+def record(titles):
+    import http_client
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    for title in titles:
+        response = http_client.get("https://en.wikipedia.org/w/api.php", params={
+            "action": "parse",
+            "page": title,
+            "prop": "text|sections",
+            "redirects": 1,
+            "disableeditsection": 1,
+            "disabletoc": 1,
+            "format": "json",
+            "formatversion": 2,
+        }, timeout=30)
+        response.raise_for_status()
+        path = os.path.join(DATA_DIR, title.replace(" ", "_") + ".json.gz")
+        with gzip.open(path, "wb") as f:
+            f.write(response.content)
+        print(f"recorded {title!r} -> {path} ({len(response.content) / 1024:.0f} KiB)")
+
+
+def synthetic_article(sections=60, paragraphs=6):
+    def paragraph(i, j):
+        year = 1500 + 7 * i + j
+        return (
+            f"<p>In <a href='/wiki/{year}'>{year}</a> the <b>Company {i}</b> faced rebellion number {j}"
+            "<sup class='reference'><a>[12]</a></sup>, which spread across the plain and ended in "
+            f"{year + 1} with a transfer of power.<sup class='noprint'>[citation needed]</sup> "
+            f"Trade in region {i}-{j}, railways &amp; telegraphs expanded from {year + 2} to {year + 9}.</p>\n"
+        )
+
+    html, meta = ["<div class='mw-parser-output'>", paragraph(0, 0) * 3], []
+    for i in range(1, sections + 1):
+        level = 2 if i % 4 == 1 else 3
+        name = "History" if i == 1 else f"Section {i}"
+        html.append(f"<div class='mw-heading mw-heading{level}'><h{level} id='s{i}'>{name}</h{level}></div>\n")
+        html.extend(paragraph(i, j) for j in range(paragraphs))
+        html.append("<ul>" + "<li>Item with a <i>note</i><sup class='reference'>[3]</sup></li>\n" * 5 + "</ul>\n")
+        meta.append({"index": str(i), "line": name, "toclevel": level - 1, "level": str(level), "anchor": f"s{i}"})
+    html.append("<div class='reflist'><ol class='references'>" + "<li>Reference text.</li>" * 400 + "</ol></div></div>")
+    return {"parse": {"title": "Synthetic history", "text": "".join(html), "sections": meta}}
+
+
+def load_articles():
+    articles = []
+    if os.path.isdir(DATA_DIR):
+        for name in sorted(os.listdir(DATA_DIR)):
+            if name.endswith(".json.gz"):
+                with gzip.open(os.path.join(DATA_DIR, name)) as f:
+                    articles.append((name[:-8], json.load(f)))
+    return articles or [("synthetic", synthetic_article())]
+
+
+def old_pipeline(html):
+    from bs4 import BeautifulSoup
+
+    text = BeautifulSoup(html, "html.parser").get_text()
+    text = re.sub(r"\[\d+\]", "", text)
+    text = re.sub(r"\^ Cite error.*", "", text)
+    text = re.sub(r"\n{2,}", "\n", text)
+    text = re.sub(r"\n\s+", "\n", text)
+    return text.strip()
+
+
+def best_of(fn, chunks, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for chunk in chunks:
+            fn(chunk)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", nargs="+", metavar="TITLE", help="fetch and store articles, then exit")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record)
+        return
+
+    from article import split_sections
+
+    for name, data in load_articles():
+        parsed = data["parse"]
+        chunks = list(split_sections(parsed["text"], parsed["sections"]).values())
+        size = sum(len(c) for c in chunks) / 1024
+        print(f"\n{name}: {len(chunks)} section chunks, {size:.0f} KiB of HTML")
+
+        baseline = best_of(old_pipeline, chunks, args.repeat)
+        print(f"  {'old bs4 + re.sub':<22} {baseline * 1000:8.1f} ms")
+        for backend in html_text.BACKENDS:
+            elapsed = best_of(lambda c: html_text.html_to_text(c, backend), chunks, args.repeat)
+            print(f"  {'html_text/' + backend:<22} {elapsed * 1000:8.1f} ms   x{baseline / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Import-time budget for the page scripts.
+
+Streamlit re-executes a page on every rerun, so each page pays its imports
+once per server process (cold) and the sys.modules lookups on every rerun
+(warm). For every page this runs its top-level imports in fresh interpreters,
+with streamlit itself already imported as it is in a running server, and
+compares the median against benchmarks/import_budgets.json. The cold budget is
+a ratio to the time `import streamlit` took in the same interpreter, so the
+budgets hold on faster and slower machines; tests/test_bench_imports.py runs
+this check:
+
+    python benchmarks/bench_imports.py            # exits 1 if a budget is exceeded
+    python benchmarks/bench_imports.py --update   # record current times (+ headroom)
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGETS_PATH = os.path.join(ROOT, "benchmarks", "import_budgets.json")
+HEADROOM = 1.5
+MIN_BUDGETS = {"cold_ratio": 0.1, "warm_ms": 1.0}
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import streamlit
+baseline = time.perf_counter() - started
+code = compile(sys.stdin.read(), "<page imports>", "exec")
+started = time.perf_counter()
+exec(code, {})
+cold = time.perf_counter() - started
+started = time.perf_counter()
+exec(code, {})
+warm = time.perf_counter() - started
+print(json.dumps({"cold_ms": cold * 1000, "cold_ratio": cold / baseline, "warm_ms": warm * 1000}))
+"""
+
+
+def pages():
+    return ["Homepage.py"] + sorted(os.path.relpath(p, ROOT) for p in glob.glob(os.path.join(ROOT, "pages", "*.py")))
+
+
+def page_imports(path):
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def measure(path, repeat):
+    imports = page_imports(path)
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD], input=imports, capture_output=True, text=True, cwd=ROOT,
+            env=dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="0"),
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{path}: imports failed\n{result.stderr.strip()}")
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return {k: statistics.median(r[k] for r in runs) for k in ("cold_ms", "cold_ratio", "warm_ms")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--update", action="store_true", help="write current times x%.1f as the budgets" % HEADROOM)
+    args = parser.parse_args()
+
+    budgets = {}
+    if os.path.exists(BUDGETS_PATH):
+        with open(BUDGETS_PATH, encoding="utf-8") as f:
+            budgets = json.load(f)
+
+    failures, recorded = [], {}
+    print(f"{'page':<28} {'cold ms':>9} {'x import':>9} {'budget':>8} {'warm ms':>9} {'budget':>8}")
+    for path in pages():
+        try:
+            times = measure(path, args.repeat)
+        except RuntimeError as e:
+            print(e)
+            failures.append(path)
+            continue
+        budget = budgets.get(path, {})
+        recorded[path] = {k: round(max(floor, times[k] * HEADROOM), 2) for k, floor in MIN_BUDGETS.items()}
+        over = [k for k in MIN_BUDGETS if k in budget and times[k] > budget[k]]
+        if over:
+            failures.append(path)
+        print(f"{path:<28} {times['cold_ms']:9.1f} {times['cold_ratio']:9.3f} {budget.get('cold_ratio', '-'):>8} "
+              f"{times['warm_ms']:9.2f} {budget.get('warm_ms', '-'):>8}{'  OVER BUDGET' if over else ''}")
+
+    if args.update:
+        with open(BUDGETS_PATH, "w", encoding="utf-8") as f:
+            json.dump(recorded, f, indent=2)
+            f.write("\n")
+        print(f"\nbudgets written to {BUDGETS_PATH}")
+        return 0
+    if failures:
+        print(f"\n{len(failures)} page(s) over budget or failing: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
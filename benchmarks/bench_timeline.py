@@ -0,0 +1,68 @@
+"""Benchmark: timeline event extraction on long history articles.
+
+Compares the old extractor (split on ". ", re.findall per sentence, first
+"history" section only) with topic_map.timeline_from_article, which scans
+every date-bearing section in one compiled pass and dedupes the events.
+Uses the same recordings as bench_html_text.py:
+
+    python benchmarks/bench_html_text.py --record "History of India" "World War II"
+    python benchmarks/bench_timeline.py
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_html_text import load_articles  # noqa: E402
+from article import Article, split_sections  # noqa: E402
+import topic_map  # noqa: E402
+
+
+def old_timeline(article):
+    history = next((s for s in article.sections if "history" in s["line"].lower()), None)
+    if history is None:
+        return []
+    timeline = []
+    for sentence in article.section_text(history["index"]).split(". "):
+        years = re.findall(r"(1[0-9]{3}|20[0-9]{2})", sentence)
+        if years:
+            timeline.append({"start_date": {"year": int(years[0])}, "text": {"text": sentence.strip()}})
+    timeline.sort(key=lambda x: x["start_date"]["year"])
+    return timeline
+
+
+def best_of(fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, data in load_articles():
+        parsed = data["parse"]
+        article = Article(title=parsed.get("title", name), exists=True, sections=parsed["sections"],
+                          section_html=split_sections(parsed["text"], parsed["sections"]))
+        text = "\n".join(article.section_text(s["index"]) for s in article.top_sections(max_level=1))
+        print(f"\n{name}: {len(article.sections)} sections, {len(text.split())} words of text")
+
+        elapsed, events = best_of(lambda: old_timeline(article), args.repeat)
+        print(f"  {'old (history section)':<26} {elapsed * 1000:8.1f} ms  {len(events):4d} events")
+        elapsed, events = best_of(lambda: topic_map.timeline_from_article(article), args.repeat)
+        print(f"  {'timeline_from_article':<26} {elapsed * 1000:8.1f} ms  {len(events):4d} events")
+        elapsed, events = best_of(lambda: topic_map.dedupe_events(topic_map.extract_events(text)), args.repeat)
+        print(f"  {'extract+dedupe (text only)':<26} {elapsed * 1000:8.1f} ms  {len(events):4d} events")
+
+
+if __name__ == "__main__":
+    main()
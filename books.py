@@ -0,0 +1,20 @@
+# books.py
+from urllib.parse import quote_plus
+
+import streamlit as st
+
+import http_cache
+
+
+# Failures propagate instead of being cached as "no books" for an hour
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_books(query):
+    url = f"https://www.googleapis.com/books/v1/volumes?q={quote_plus(query)}"
+    books = http_cache.get_json(url, timeout=5).get("items", [])[:10]
+    return [{
+        "title": b["volumeInfo"].get("title", "No title"),
+        "authors": b["volumeInfo"].get("authors", []),
+        "desc": b["volumeInfo"].get("description", "No description."),
+        "thumbnail": b["volumeInfo"].get("imageLinks", {}).get("thumbnail", ""),
+        "preview": b["volumeInfo"].get("previewLink", "")
+    } for b in books]
@@ -0,0 +1,15 @@
+# careers.py
+import streamlit as st
+
+from article import load_article
+
+
+# ✅ Wikipedia Extractor (Summary + Content)
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_career_related_content(query):
+    article = load_article(query)
+    content = " ".join(
+        article.section_text(section["index"])
+        for section in article.find_sections("career", "application")
+    )
+    return article.summary, content
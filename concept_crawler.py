@@ -0,0 +1,116 @@
+# concept_crawler.py
+# Breadth-first expansion of a topic through Wikipedia article links.
+#
+# Each level is fetched as batched `prop=links` queries (up to 50 titles per
+# request) on a small thread pool, so a 2-hop map costs a handful of requests
+# per level rather than one per article. `pllimit` is shared by every title in
+# a request, so a level is split evenly across the workers instead of packing
+# 50 titles into one long chain of continuations. Edges are yielded as batches
+# arrive so the page can draw the graph while the crawl is still running.
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import http_cache
+
+MAX_TITLES_PER_QUERY = 50
+MAX_WORKERS = 4
+# Links kept per expanded article, by level: the root keeps 30, each of those 6
+FANOUT = (30, 6)
+# Extra `plcontinue` pages (500 links each) fetched per batch before giving up
+MAX_CONTINUATIONS = 10
+DEADLINE = 8.0
+
+WORD_RE = re.compile(r"\w+")
+# Authority-control and identifier stubs linked from nearly every article
+SKIP_LINK_RE = re.compile(r"\((?:identifier|disambiguation)\)$|^(?:List|Lists|Index|Outline) of ")
+
+
+def _query_links(titles, lang):
+    """{requested title: [linked titles]} for one batch, following continuations."""
+    params = {
+        "action": "query",
+        "titles": "|".join(titles),
+        "prop": "links",
+        "plnamespace": 0,
+        "pllimit": "max",
+        "redirects": 1,
+        "format": "json",
+        "formatversion": 2,
+    }
+    # Map normalized / redirected titles back to what was asked for
+    canonical = {t: t for t in titles}
+    links = {t: [] for t in titles}
+    for _ in range(1 + MAX_CONTINUATIONS):
+        data = http_cache.get_json(f"https://{lang}.wikipedia.org/w/api.php", params=params)
+        query = data.get("query", {})
+        for step in query.get("normalized", []) + query.get("redirects", []):
+            if step["from"] in canonical:
+                canonical[step["to"]] = canonical[step["from"]]
+        for page in query.get("pages", []):
+            source = canonical.get(page.get("title"))
+            if source is not None:
+                links[source].extend(link["title"] for link in page.get("links", []))
+        if "continue" not in data:
+            break
+        params = {**params, **data["continue"]}
+    return links
+
+
+def rank_links(links, keywords):
+    """Links ordered by how many keyword tokens their titles share, then as given."""
+    keywords = {w.lower() for k in keywords for w in WORD_RE.findall(k)}
+    scored = []
+    for position, title in enumerate(links):
+        if SKIP_LINK_RE.search(title):
+            continue
+        overlap = len(keywords.intersection(w.lower() for w in WORD_RE.findall(title)))
+        scored.append((-overlap, position, title))
+    scored.sort()
+    return [title for _, _, title in scored]
+
+
+def crawl(root, depth=2, keywords=(), fanout=FANOUT, deadline=DEADLINE, lang="en"):
+    """Yield (source, target, level) edges breadth-first, as link batches arrive.
+
+    Titles already in the graph are linked to but never expanded again, so
+    cycles end there. The crawl stops early once `deadline` seconds pass.
+    """
+    stop_at = time.monotonic() + deadline
+    seen = {root.casefold()}
+    frontier = [root]
+
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="crawl")
+    try:
+        for level in range(1, depth + 1):
+            keep = fanout[min(level - 1, len(fanout) - 1)]
+            size = min(MAX_TITLES_PER_QUERY, -(-len(frontier) // MAX_WORKERS))
+            batches = [frontier[i:i + size] for i in range(0, len(frontier), size)]
+            pending = {pool.submit(_query_links, batch, lang) for batch in batches}
+            next_frontier = []
+
+            while pending:
+                remaining = stop_at - time.monotonic()
+                if remaining <= 0:
+                    return
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        links = future.result()
+                    except Exception as e:
+                        print(f"[Crawler] link batch failed: {e}")
+                        continue
+                    for source, targets in links.items():
+                        targets = [t for t in targets if t.casefold() != source.casefold()]
+                        for target in rank_links(targets, keywords)[:keep]:
+                            if target.casefold() not in seen:
+                                seen.add(target.casefold())
+                                next_frontier.append(target)
+                            yield source, target, level
+
+            frontier = next_frontier
+            if not frontier:
+                return
+    finally:
+        # Don't hold the page up for batches still in flight past the deadline
+        pool.shutdown(wait=False, cancel_futures=True)
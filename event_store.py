@@ -0,0 +1,173 @@
+# event_store.py
+# Persistent, year-indexed store of timeline events across every explored topic.
+#
+# generate_topic_timeline writes each topic's events here, so known topics
+# render without re-extracting, and the Concept Mapping page can ask for
+# "everything between 1900 and 1950 across these topics" in one indexed query.
+#
+# Batch fill:  python event_store.py backfill "World War II" "History of India"
+#              python event_store.py backfill --file topics.txt
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+from http_cache import CACHE_DIR
+
+EVENT_STORE_PATH = os.path.join(CACHE_DIR, "events.sqlite3")
+EVENTS_TTL = 7 * 24 * 60 * 60
+
+
+def topic_key(topic):
+    return " ".join(topic.replace("_", " ").split()).casefold()
+
+
+class EventStore:
+    def __init__(self, path=EVENT_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn().executescript("""
+            CREATE TABLE IF NOT EXISTS topics (
+                topic_key TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS events (
+                topic_key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                year INTEGER NOT NULL,
+                month INTEGER,
+                day INTEGER,
+                end_year INTEGER,
+                headline TEXT NOT NULL,
+                text TEXT NOT NULL,
+                PRIMARY KEY (topic_key, position)
+            );
+            CREATE INDEX IF NOT EXISTS events_year_topic ON events(year, topic_key);
+        """)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def record(self, topic, events):
+        """Replace everything stored for `topic` with `events` (TimelineJS dicts)."""
+        key = topic_key(topic)
+        rows = [
+            (key, position, e["start_date"]["year"], e["start_date"].get("month"), e["start_date"].get("day"),
+             e.get("end_date", {}).get("year"), e["text"]["headline"], e["text"]["text"])
+            for position, e in enumerate(events)
+        ]
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM events WHERE topic_key = ?", (key,))
+            conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.execute("INSERT OR REPLACE INTO topics VALUES (?, ?, ?)", (key, topic, time.time()))
+
+    def events_for(self, topic, max_age=EVENTS_TTL):
+        """Stored events for `topic`, or None if it was never recorded (or is stale)."""
+        key = topic_key(topic)
+        row = self._conn().execute("SELECT updated_at FROM topics WHERE topic_key = ?", (key,)).fetchone()
+        if row is None or (max_age is not None and time.time() - row[0] > max_age):
+            return None
+        rows = self._conn().execute(
+            "SELECT year, month, day, end_year, headline, text FROM events WHERE topic_key = ? ORDER BY position",
+            (key,),
+        ).fetchall()
+        return [_to_event(r) for r in rows]
+
+    def events_between(self, start_year, end_year, topics=None, limit=200):
+        """Events from `start_year` to `end_year` (inclusive), optionally only for `topics`."""
+        sql = ("SELECT e.year, e.month, e.day, e.end_year, e.headline, e.text, t.topic "
+               "FROM events e JOIN topics t ON t.topic_key = e.topic_key WHERE e.year BETWEEN ? AND ?")
+        params = [start_year, end_year]
+        if topics is not None:
+            keys = sorted({topic_key(t) for t in topics})
+            if not keys:
+                return []
+            sql += f" AND e.topic_key IN ({', '.join('?' * len(keys))})"
+            params.extend(keys)
+        sql += " ORDER BY e.year, e.month, e.day LIMIT ?"
+        params.append(limit)
+
+        events = []
+        for *row, topic in self._conn().execute(sql, params):
+            event = _to_event(row)
+            event["group"] = topic
+            events.append(event)
+        return events
+
+    def known_topics(self):
+        return [r[0] for r in self._conn().execute("SELECT topic FROM topics ORDER BY topic")]
+
+
+def _to_event(row):
+    year, month, day, end_year, headline, text = row
+    start = {"year": year}
+    if month:
+        start["month"] = month
+    if day:
+        start["day"] = day
+    event = {"start_date": start, "text": {"headline": headline, "text": text}}
+    if end_year is not None:
+        event["end_date"] = {"year": end_year}
+    return event
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = EventStore()
+    return _store
+
+
+def backfill(topics):
+    from article import fetch_article
+    from topic_map import timeline_from_article
+
+    store = get_store()
+    for topic in topics:
+        try:
+            article = fetch_article(topic)
+        except Exception as e:
+            print(f"skip {topic!r}: {e}")
+            continue
+        if not article.exists:
+            print(f"skip {topic!r}: no article")
+            continue
+        events = timeline_from_article(article)
+        store.record(article.title, events)
+        print(f"{article.title}: {len(events)} events")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the timeline event store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fill = sub.add_parser("backfill", help="extract and store events for topics")
+    fill.add_argument("topics", nargs="*")
+    fill.add_argument("--file", help="text file with one topic per line")
+    args = parser.parse_args()
+
+    topics = list(args.topics)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            topics.extend(line.strip() for line in f if line.strip())
+    backfill(topics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# graph_render.py
+# Concept graph -> self-contained pyvis HTML, built in memory.
+#
+# vis-network is inlined from the vendored lib/ directory (tom-select too, but
+# pyvis only includes it when the select/filter menus are on, and they're off
+# here). pyvis's template also links Bootstrap from a CDN just to style the
+# card around the graph; those tags are stripped from the template, so the
+# component makes no network requests and nothing is written to disk per render.
+# networkx and pyvis (which pulls in IPython) are imported on first render, so
+# a page whose graph HTML is already cached never loads them.
+#
+# Large graphs can be laid out here instead of by vis-network physics in the
+# browser: positions are computed once with networkx (seeded, so the same
+# graph always looks the same), written into the nodes, and physics is off.
+import functools
+import math
+import os
+import re
+from importlib.util import find_spec
+
+import streamlit as st
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# networkx needs scipy for both layouts on anything but small graphs
+LAYOUTS = ("spring", "kamada_kawai") if find_spec("scipy") else ()
+LAYOUT_SEED = 42
+# Above this many nodes the page precomputes the layout by default
+SERVER_LAYOUT_MIN_NODES = 150
+
+# pyvis's Bootstrap <link .../> and <script ...></script> tags
+CDN_TAG_RE = re.compile(r'<(link|script)\b[^>]*https://cdn\.jsdelivr\.net/[^>]*>(?:\s*</script>)?', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _layout_positions(method, seed, nodes, edges):
+    import networkx as nx
+
+    graph = nx.Graph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    if method == "kamada_kawai":
+        pos = nx.kamada_kawai_layout(graph)
+    else:
+        pos = nx.spring_layout(graph, seed=seed)
+    # vis-network works in pixels; spread the unit square with the node count
+    scale = max(300, 60 * math.sqrt(len(nodes)))
+    return {node: (float(x) * scale, float(y) * scale) for node, (x, y) in pos.items()}
+
+
+def compute_layout(graph, method="spring", seed=LAYOUT_SEED):
+    """{node: (x, y)} in pixels, cached per graph structure."""
+    nodes = tuple(sorted(graph.nodes, key=str))
+    edges = tuple(sorted((tuple(sorted(e, key=str)) for e in graph.edges), key=str))
+    return _layout_positions(method, seed, nodes, edges)
+
+
+@functools.lru_cache(maxsize=1)
+def _template_env(pyvis_template_dir):
+    from jinja2 import ChoiceLoader, Environment, FileSystemLoader, FunctionLoader
+
+    pyvis_loader = FileSystemLoader(pyvis_template_dir)
+
+    def offline_template(name):
+        if name != "template.html":
+            return None
+        source, filename, _uptodate = pyvis_loader.get_source(None, name)
+        return CDN_TAG_RE.sub("", source), filename, lambda: True
+
+    # pyvis includes "lib/..." relative to its template loader; look in the repo first
+    return Environment(loader=ChoiceLoader([FileSystemLoader(ROOT), FunctionLoader(offline_template), pyvis_loader]))
+
+
+def network_html(graph, height="500px", width="100%", bgcolor="#222222", font_color="white", layout=None):
+    from pyvis.network import Network
+
+    net = Network(height=height, width=width, bgcolor=bgcolor, font_color=font_color, cdn_resources="in_line")
+    net.templateEnv = _template_env(net.template_dir)
+    net.from_nx(graph)
+
+    if layout is not None:
+        if layout not in LAYOUTS:
+            print(f"⚠️ Graph layout {layout!r} unavailable (needs scipy); using browser physics.")
+        else:
+            positions = compute_layout(graph, layout)
+            for node in net.nodes:
+                node["x"], node["y"] = positions[node["id"]]
+            net.toggle_physics(False)
+    return net.generate_html()
+
+
+# Node size by hop distance from the topic for linked articles
+LINK_NODE_SIZES = {1: 16, 2: 8}
+
+
+def concept_graph(topic, keywords, edges=()):
+    """The topic joined to its summary keywords, plus crawled (source, target, level) links."""
+    import networkx as nx
+
+    graph = nx.Graph()
+    graph.add_node(topic, size=30, title=topic)
+    for kw in keywords:
+        graph.add_node(kw, size=10, title=kw)
+        graph.add_edge(topic, kw)
+    for source, target, level in edges:
+        if target not in graph:
+            graph.add_node(target, size=LINK_NODE_SIZES.get(level, 6), title=target, color="#f0a30a")
+        graph.add_edge(source, target)
+    return graph
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def concept_graph_html(topic, keywords, edges=(), height="500px", layout=None):
+    return network_html(concept_graph(topic, keywords, edges), height=height, layout=layout)
@@ -0,0 +1,128 @@
+# graph_store.py
+# Persistent topic -> linked-article adjacency shared by every session.
+#
+# Crawled link edges are written here as topics are explored, so a topic whose
+# neighbourhood is already known renders its concept map straight from SQLite
+# (one recursive query) without touching Wikipedia.
+import os
+import sqlite3
+import threading
+import time
+
+from event_store import topic_key
+from http_cache import CACHE_DIR
+
+GRAPH_STORE_PATH = os.path.join(CACHE_DIR, "graph.sqlite3")
+GRAPH_TTL = 7 * 24 * 60 * 60
+MAX_NEIGHBOURHOOD_EDGES = 1000
+
+
+class GraphStore:
+    def __init__(self, path=GRAPH_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn().executescript("""
+            CREATE TABLE IF NOT EXISTS edges (
+                src_key TEXT NOT NULL,
+                dst_key TEXT NOT NULL,
+                src TEXT NOT NULL,
+                dst TEXT NOT NULL,
+                rank INTEGER NOT NULL,
+                PRIMARY KEY (src_key, dst_key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS edges_dst ON edges(dst_key);
+            CREATE TABLE IF NOT EXISTS crawls (
+                topic_key TEXT PRIMARY KEY,
+                depth INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def record_crawl(self, topic, depth, edges):
+        """Store the (source, target, level) edges of a crawl from `topic`.
+
+        The root's outgoing edges are replaced, so a re-crawl with different
+        ranking doesn't pile up stale links. Deeper sources were only expanded
+        with a small fan-out here, so their edges are merged in rather than
+        replacing what their own crawl stored.
+        """
+        outgoing = {}
+        for source, target, _level in edges:
+            outgoing.setdefault(source, []).append(target)
+
+        root_key = topic_key(topic)
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM edges WHERE src_key = ?", (root_key,))
+            for source, targets in outgoing.items():
+                src_key = topic_key(source)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO edges VALUES (?, ?, ?, ?, ?)",
+                    [(src_key, topic_key(t), source, t, rank) for rank, t in enumerate(targets)],
+                )
+            conn.execute("INSERT OR REPLACE INTO crawls VALUES (?, ?, ?)", (root_key, depth, time.time()))
+
+    def has_neighbourhood(self, topic, depth, max_age=GRAPH_TTL):
+        row = self._conn().execute(
+            "SELECT depth, updated_at FROM crawls WHERE topic_key = ?", (topic_key(topic),)
+        ).fetchone()
+        return row is not None and row[0] >= depth and time.time() - row[1] <= max_age
+
+    def neighbourhood(self, topic, k, limit=MAX_NEIGHBOURHOOD_EDGES):
+        """(source, target, hop) edges within `k` hops of `topic`, nearest first.
+
+        Titles are returned with one spelling per node: `topic` as the caller
+        wrote it, and whichever stored spelling comes first for the rest, so
+        "India" and "india" from different crawls don't become two nodes.
+        """
+        root_key = topic_key(topic)
+        rows = self._conn().execute("""
+            WITH RECURSIVE hood(key, hop) AS (
+                SELECT ?, 0
+                UNION
+                SELECT e.dst_key, h.hop + 1 FROM edges e JOIN hood h ON e.src_key = h.key
+                WHERE h.hop + 1 < ?
+            )
+            SELECT e.src_key, e.src, e.dst_key, e.dst, MIN(h.hop) + 1 AS hop
+            FROM hood h JOIN edges e ON e.src_key = h.key
+            GROUP BY e.src_key, e.dst_key
+            ORDER BY hop, MIN(e.rank), e.src_key
+            LIMIT ?
+        """, (root_key, k, limit)).fetchall()
+
+        names = {root_key: topic}
+        return [
+            (names.setdefault(src_key, src), names.setdefault(dst_key, dst), hop)
+            for src_key, src, dst_key, dst, hop in rows
+        ]
+
+    def stats(self):
+        conn = self._conn()
+        return {
+            "edges": conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0],
+            "crawled_topics": conn.execute("SELECT COUNT(*) FROM crawls").fetchone()[0],
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = GraphStore()
+    return _store
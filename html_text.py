@@ -0,0 +1,94 @@
+# html_text.py
+# Shared HTML -> plain text extraction for Wikipedia section HTML.
+#
+# Reference markers, edit links, reference lists and inline styles/scripts are
+# dropped while the document is parsed, so the text pass afterwards only has
+# whitespace and stray citation junk left to clean up. The fastest available
+# parser is used: selectolax, then lxml, then BeautifulSoup's html.parser.
+import re
+from importlib.util import find_spec
+
+
+def _available(module):
+    try:
+        return find_spec(module) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+BACKENDS = [name for name, module in (("selectolax", "selectolax.lexbor"), ("lxml", "lxml.html"), ("bs4", "bs4"))
+            if _available(module)]
+BACKEND = BACKENDS[0] if BACKENDS else "bs4"
+
+# (tag, class) pairs removed during parsing; class None means "any"
+STRIP_NODES = [
+    ("style", None),
+    ("script", None),
+    ("sup", "reference"),
+    ("sup", "noprint"),
+    ("span", "mw-editsection"),
+    ("span", "mw-cite-backlink"),
+    ("ol", "references"),
+    ("div", "reflist"),
+    ("div", "mw-references-wrap"),
+]
+STRIP_CSS = ", ".join(tag if cls is None else f"{tag}.{cls}" for tag, cls in STRIP_NODES)
+STRIP_XPATH = " | ".join(
+    f"//{tag}" if cls is None else f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+    for tag, cls in STRIP_NODES
+)
+
+CITATION_RE = re.compile(r"\[\d+\]")
+CITE_ERROR_RE = re.compile(r"\^ Cite error.*")
+BLANK_LINES_RE = re.compile(r"\n{2,}")
+INDENTED_LINE_RE = re.compile(r"\n\s+")
+
+
+def _raw_text_selectolax(html):
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    for node in tree.css(STRIP_CSS):
+        node.decompose()
+    root = tree.body if tree.body is not None else tree.root
+    return root.text(deep=True, separator="", strip=False) if root is not None else ""
+
+
+def _raw_text_lxml(html):
+    import lxml.html
+
+    root = lxml.html.fragment_fromstring(html, create_parent="div")
+    for node in root.xpath(STRIP_XPATH):
+        node.drop_tree()
+    return root.text_content()
+
+
+def _raw_text_bs4(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    for node in soup.select(STRIP_CSS):
+        node.decompose()
+    return soup.get_text()
+
+
+_RAW_TEXT = {
+    "selectolax": _raw_text_selectolax,
+    "lxml": _raw_text_lxml,
+    "bs4": _raw_text_bs4,
+}
+
+
+def clean_text(text):
+    text = CITATION_RE.sub("", text)
+    text = CITE_ERROR_RE.sub("", text)
+    text = BLANK_LINES_RE.sub("\n", text)
+    text = INDENTED_LINE_RE.sub("\n", text)
+    return text.strip()
+
+
+def html_to_text(html, backend=None):
+    """Readable text of a chunk of Wikipedia HTML, without references or edit links."""
+    if not html or not html.strip():
+        return ""
+    return clean_text(_RAW_TEXT[backend or BACKEND](html))
@@ -0,0 +1,207 @@
+# http_cache.py
+# Persistent SQLite response cache that sits under every Wikipedia fetch, so a
+# restarted server answers from disk instead of re-downloading everything.
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+import http_client
+import singleflight
+
+CACHE_DIR = os.environ.get("WIKITRAIL_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+HTTP_CACHE_PATH = os.path.join(CACHE_DIR, "http_cache.sqlite3")
+HTTP_CACHE_MAX_BYTES = int(os.environ.get("WIKITRAIL_HTTP_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+DEFAULT_TTL = 60 * 60
+
+# (host suffix, path fragment or api action, ttl seconds) — first match wins
+ENDPOINT_TTLS = [
+    ("wikipedia.org", "/page/summary/", 6 * 60 * 60),
+    ("wikipedia.org", "action=parse", 12 * 60 * 60),
+    ("wikipedia.org", "action=query", 24 * 60 * 60),
+    ("wikipedia.org", "action=opensearch", 24 * 60 * 60),
+    ("googleapis.com", "/books/", 24 * 60 * 60),
+]
+
+
+def ttl_for(url, params=None):
+    parsed = urlparse(url)
+    target = parsed.path + "?" + (urlencode(params or {}) if params else parsed.query)
+    for host, fragment, ttl in ENDPOINT_TTLS:
+        if parsed.netloc.endswith(host) and fragment in target:
+            return ttl
+    return DEFAULT_TTL
+
+
+def cache_key(url, params=None):
+    if not params:
+        return url
+    return url + "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+
+
+class Store:
+    """Size-bounded key/value table in SQLite with TTL metadata and LRU eviction.
+
+    One connection per thread; Streamlit serves each session from its own thread.
+    """
+
+    def __init__(self, path, table="entries", max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.path = path
+        self.table = table
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._evict_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn().execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                meta TEXT NOT NULL DEFAULT '{{}}',
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn().execute(f"CREATE INDEX IF NOT EXISTS {table}_lru ON {table}(last_access)")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        """Return (value, meta, is_fresh) or None."""
+        row = self._conn().execute(
+            f"SELECT value, meta, expires_at FROM {self.table} WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        self._conn().execute(f"UPDATE {self.table} SET last_access = ? WHERE key = ?", (now, key))
+        return row[0], json.loads(row[1]), row[2] > now
+
+    def put(self, key, value, ttl, meta=None):
+        now = time.time()
+        self._conn().execute(
+            f"INSERT OR REPLACE INTO {self.table} (key, value, meta, expires_at, last_access, size) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, value, json.dumps(meta or {}), now + ttl, now, len(value)),
+        )
+        self.evict()
+
+    def touch(self, key, ttl):
+        now = time.time()
+        self._conn().execute(
+            f"UPDATE {self.table} SET expires_at = ?, last_access = ? WHERE key = ?", (now + ttl, now, key)
+        )
+
+    def delete(self, key):
+        self._conn().execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def scan(self, pattern="%"):
+        """Yield (key, value) for keys matching a SQL LIKE pattern, without touching LRU order."""
+        yield from self._conn().execute(f"SELECT key, value FROM {self.table} WHERE key LIKE ?", (pattern,))
+
+    def total_bytes(self):
+        return self._conn().execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+
+    def evict(self):
+        with self._evict_lock:
+            excess = self.total_bytes() - self.max_bytes
+            if excess <= 0:
+                return
+            doomed = []
+            for key, size in self._conn().execute(f"SELECT key, size FROM {self.table} ORDER BY last_access"):
+                doomed.append((key,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._conn().executemany(f"DELETE FROM {self.table} WHERE key = ?", doomed)
+
+
+_store = None
+_store_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "revalidated": 0, "stale_served": 0}
+_stats_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = Store(HTTP_CACHE_PATH, table="responses")
+    return _store
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def stats():
+    with _stats_lock:
+        return dict(_stats)
+
+
+_flight = singleflight.Group("http")
+
+
+def get_json(url, params=None, ttl=None, timeout=10, headers=None):
+    """GET `url` and return its JSON body, going through the on-disk cache.
+
+    Fresh entries are served without touching the network. Stale entries are
+    revalidated with If-None-Match / If-Modified-Since, and served as-is if
+    the upstream is unreachable. Concurrent misses for the same URL share a
+    single upstream request.
+    """
+    store = get_store()
+    key = cache_key(url, params)
+    cached = store.get(key)
+
+    if cached and cached[2]:
+        _count("hits")
+        return json.loads(cached[0])
+
+    ttl = ttl_for(url, params) if ttl is None else ttl
+    body = _flight.do(key, _fetch, store, key, url, params, ttl, timeout, headers, cached)
+    return json.loads(body)
+
+
+def _fetch(store, key, url, params, ttl, timeout, headers, cached):
+    request_headers = dict(headers or {})
+    if cached:
+        meta = cached[1]
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = http_client.get(url, params=params, headers=request_headers, timeout=timeout)
+        if cached and response.status_code == 304:
+            _count("revalidated")
+            store.touch(key, ttl)
+            return cached[0]
+        response.raise_for_status()
+    except Exception:
+        if cached:
+            _count("stale_served")
+            return cached[0]
+        raise
+
+    _count("misses")
+    body = response.content
+    json.loads(body)  # don't cache anything we couldn't hand back
+    store.put(key, body, ttl, meta={
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    })
+    return body
@@ -0,0 +1,68 @@
+# http_client.py
+# Shared keep-alive HTTP client. One requests.Session per host, so repeated calls
+# to Wikipedia, Google Books, Hugging Face or Ollama reuse warm TCP/TLS
+# connections instead of handshaking on every request.
+import os
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = os.environ.get(
+    "WIKITRAIL_USER_AGENT",
+    "wikiverse-bot/1.0 (https://github.com/Saikiran0478/wikitrail00)",
+)
+
+# (connect, read) seconds; callers can still pass their own `timeout=`
+DEFAULT_TIMEOUT = (3.05, 15)
+POOL_MAXSIZE = int(os.environ.get("WIKITRAIL_HTTP_POOL_SIZE", 16))
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=1, pool_block=False)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def session_for(url):
+    """Return the pooled session for the host `url` points at."""
+    parsed = urlparse(url)
+    host = f"{parsed.scheme}://{parsed.netloc}"
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = _new_session()
+    return session
+
+
+def request(method, url, **kwargs):
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return session_for(url).request(method, url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def close_all():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,187 @@
+# keywords.py
+# TF-IDF keyword and key-phrase ranking for the concept graph.
+#
+# Candidates are single words plus 2–3 word phrases (runs of content words
+# between stopwords and punctuation). Each is scored by its frequency in the
+# text times the mean IDF of its words (phrases get a small length bonus), with
+# IDF looked up in a table built offline from the articles in the HTTP cache:
+#
+#     python keywords.py build-idf
+#
+# The table is two .npy arrays — sorted vocabulary and float32 IDF — opened
+# memory-mapped once per process and searched with np.searchsorted.
+import argparse
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+import stopwords_i18n
+from http_cache import CACHE_DIR
+
+IDF_DIR = os.environ.get("WIKITRAIL_IDF_DIR", os.path.join(CACHE_DIR, "idf"))
+TOP_K = 25
+MAX_NGRAM = 3
+MIN_DF = 2
+MAX_TERM_LENGTH = 32
+PHRASE_BONUS = 0.5  # score multiplier per extra word in a phrase
+ALL_STOP_WORDS = frozenset().union(*stopwords_i18n.STOP_WORDS.values())
+
+# Phrases end at punctuation as well as at stopwords
+PHRASE_BREAK_RE = re.compile(r"[.,;:!?()\[\]{}\"“”‘’/|–—।॥]+|\s-\s")
+
+
+def _runs(text, stop_words):
+    """Lists of consecutive content words, lowercased."""
+    for chunk in PHRASE_BREAK_RE.split(text):
+        run = []
+        for word in stopwords_i18n.tokenize(chunk):
+            word = word.lower()
+            if word in stop_words or len(word) < 3 or len(word) > MAX_TERM_LENGTH:
+                if run:
+                    yield run
+                run = []
+            else:
+                run.append(word)
+        if run:
+            yield run
+
+
+def candidates(text, stop_words, max_ngram=MAX_NGRAM):
+    """Counter of candidate terms (tuples of words), plus each term's first position."""
+    counts, first_seen = Counter(), {}
+    for run in _runs(text, stop_words):
+        for n in range(1, max_ngram + 1):
+            for i in range(len(run) - n + 1):
+                term = tuple(run[i:i + n])
+                counts[term] += 1
+                first_seen.setdefault(term, len(first_seen))
+    return counts, first_seen
+
+
+class IdfTable:
+    def __init__(self, vocab, idf, documents):
+        self.vocab = vocab
+        self.idf = idf
+        self.documents = documents
+        # Words never seen offline count as if they had df = 0
+        self.unknown_idf = math.log(documents + 1) + 1.0
+
+    @classmethod
+    def load(cls, path=IDF_DIR):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        vocab = np.load(os.path.join(path, "vocab.npy"), mmap_mode="r")
+        idf = np.load(os.path.join(path, "idf.npy"), mmap_mode="r")
+        return cls(vocab, idf, meta["documents"])
+
+    def lookup(self, words):
+        """IDF for each word in `words`, as a float array."""
+        words = np.asarray(words, dtype=str)
+        result = np.full(len(words), self.unknown_idf, dtype=np.float32)
+        if len(self.vocab) and len(words):
+            pos = np.searchsorted(self.vocab, words)
+            pos[pos == len(self.vocab)] = 0
+            found = self.vocab[pos] == words
+            result[found] = self.idf[pos[found]]
+        return result
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def get_idf_table():
+    """The offline IDF table, or a flat one (pure term frequency) if none was built."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                try:
+                    _table = IdfTable.load()
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"⚠️ No IDF table at {IDF_DIR} ({e}); ranking keywords by frequency only.")
+                    _table = IdfTable(np.array([], dtype="<U1"), np.array([], dtype=np.float32), 0)
+    return _table
+
+
+def top_keywords(text, k=TOP_K, lang="en", table=None):
+    """The `k` best terms and phrases in `text`, best first. Deterministic for a given table."""
+    stop_words = stopwords_i18n.stop_words(lang)
+    table = get_idf_table() if table is None else table
+    counts, first_seen = candidates(text, stop_words)
+    if not counts:
+        return []
+
+    terms = list(counts)
+    words = sorted({w for term in terms for w in term})
+    word_idf = dict(zip(words, table.lookup(words).tolist()))
+    tf = np.fromiter((counts[t] for t in terms), dtype=np.float32, count=len(terms))
+    idf = np.fromiter((sum(word_idf[w] for w in t) / len(t) for t in terms), dtype=np.float32, count=len(terms))
+    length = np.fromiter((len(t) for t in terms), dtype=np.float32, count=len(terms))
+    scores = tf * idf * (1 + PHRASE_BONUS * (length - 1))
+    order = np.lexsort((np.fromiter((first_seen[t] for t in terms), dtype=np.int64, count=len(terms)), -scores))
+
+    # Each word appears in at most one picked term, so overlapping n-grams
+    # ("indus river", "river flows") don't crowd out other concepts
+    picked, used = [], set()
+    for i in order:
+        term = terms[i]
+        if used.intersection(term):
+            continue
+        picked.append(" ".join(term))
+        used.update(term)
+        if len(picked) == k:
+            break
+    return picked
+
+
+def build_idf(out_dir=IDF_DIR, min_df=MIN_DF):
+    """Document frequencies over every parsed article in the HTTP cache -> .npy table."""
+    import http_cache
+    from html_text import html_to_text
+
+    df, seen_titles = Counter(), set()
+    for _key, body in http_cache.get_store().scan("%action=parse%"):
+        try:
+            parsed = json.loads(body).get("parse") or {}
+        except ValueError:
+            continue
+        title = parsed.get("title")
+        if not title or title in seen_titles or not parsed.get("text"):
+            continue
+        seen_titles.add(title)
+        text = html_to_text(parsed["text"])
+        # Every language's stopwords apply, since the cache holds all of them
+        df.update({w for run in _runs(text, ALL_STOP_WORDS) for w in run})
+
+    documents = len(seen_titles)
+    vocab = sorted(w for w, n in df.items() if n >= min_df)
+    width = max((len(w) for w in vocab), default=1)
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, "vocab.npy"), np.array(vocab, dtype=f"<U{width}"))
+    idf = [math.log((documents + 1) / (df[w] + 1)) + 1.0 for w in vocab]
+    np.save(os.path.join(out_dir, "idf.npy"), np.array(idf, dtype=np.float32))
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"documents": documents, "terms": len(vocab), "min_df": min_df}, f)
+    return documents, len(vocab)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword IDF table tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build-idf", help="build the IDF table from cached articles")
+    build.add_argument("--out", default=IDF_DIR)
+    build.add_argument("--min-df", type=int, default=MIN_DF)
+    args = parser.parse_args()
+
+    documents, terms = build_idf(args.out, args.min_df)
+    print(f"IDF table: {terms} terms from {documents} articles -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
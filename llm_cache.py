@@ -0,0 +1,56 @@
+# llm_cache.py
+# Disk-backed cache of Ollama completions keyed on (model, normalized prompt,
+# options), so repeated questions skip the local model entirely.
+import hashlib
+import json
+import os
+import re
+import threading
+
+from http_cache import CACHE_DIR, Store
+
+LLM_CACHE_PATH = os.path.join(CACHE_DIR, "llm_cache.sqlite3")
+LLM_CACHE_MAX_BYTES = int(os.environ.get("WIKITRAIL_LLM_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+LLM_CACHE_TTL = int(os.environ.get("WIKITRAIL_LLM_CACHE_TTL", 7 * 24 * 60 * 60))
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+_store = None
+_store_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = Store(LLM_CACHE_PATH, table="completions", max_bytes=LLM_CACHE_MAX_BYTES)
+    return _store
+
+
+def normalize_prompt(prompt):
+    return WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+def cache_key(model, prompt, options=None):
+    raw = json.dumps([model, normalize_prompt(prompt), options or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(model, prompt, options=None):
+    cached = get_store().get(cache_key(model, prompt, options))
+    hit = cached is not None and cached[2]
+    with _stats_lock:
+        _stats["hits" if hit else "misses"] += 1
+    return cached[0].decode("utf-8") if hit else None
+
+
+def put(model, prompt, response, options=None, ttl=LLM_CACHE_TTL):
+    get_store().put(cache_key(model, prompt, options), response.encode("utf-8"), ttl)
+
+
+def stats():
+    with _stats_lock:
+        return dict(_stats)
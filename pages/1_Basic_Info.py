@@ -1,7 +1,11 @@
 # pages/1_Basic_Info.py
 
 import streamlit as st
-import requests
+import translation
+import section_markdown
+from html_text import html_to_text
+from section_markdown import format_section
+from article import load_article, load_article_or_empty
 from utils import render_chatbot, generate_advanced_info, get_topic_emoji, render_footer
 
 st.set_page_config(
@@ -56,14 +60,10 @@ st.caption(f"🔤 Language: {language}")
 
 # --- Wikipedia API Call ---
 def get_summary(topic, lang="en"):
-    try:
-        url = f"https://{lang}.wikipedia.org/api/rest_v1/page/summary/{topic.replace(' ', '_')}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("title", topic), data.get("extract", "No summary available."), data.get("thumbnail", {}).get("source", None)
-    except Exception as e:
+    article = load_article_or_empty(topic, lang)
+    if not article.exists:
         return topic, "Error retrieving summary.", None
+    return article.title, article.summary or "No summary available.", article.thumbnail
 
 
 # Language code mapping (for Wikipedia API)
@@ -76,7 +76,12 @@ lang_map = {
 }
 wiki_lang = lang_map.get(language, "en")
 
-title, summary, image = get_summary(topic, lang=wiki_lang)
+# No article in the chosen language? Use English Wikipedia and translate it
+content_lang = wiki_lang if wiki_lang == "en" or load_article_or_empty(topic, wiki_lang).exists else "en"
+translate_to = None if content_lang == wiki_lang else wiki_lang
+
+title, summary, image = get_summary(topic, lang=content_lang)
+summary = translation.translate_document(summary, translate_to)
 
 # --- Display Summary ---
 col1, col2 = st.columns([2, 1])
@@ -99,108 +104,51 @@ if st.button("Next ➡️ Concept Mapping"):
 st.markdown("### 📘 Advanced Information (from Wikipedia Sections)")
 
 def get_wikipedia_sections(topic, lang="en"):
-    url = f"https://{lang}.wikipedia.org/w/api.php"
-    params = {
-        "action": "parse",
-        "page": topic,
-        "format": "json",
-        "prop": "sections"
-    }
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        sections = response.json().get("parse", {}).get("sections", [])
-        return [s for s in sections if int(s["toclevel"]) <= 2]
-    except Exception as e:
-        return []
-
-def get_section_content(topic, section_index, lang="en"):
-    import bs4, re
-
-    # --- Emoji map for topic categories ---
-    emoji_map = {
-        "dinosaurs": "🦕",
-        "space": "🚀",
-        "astronomy": "🌌",
-        "robot": "🤖",
-        "robotics": "🤖",
-        "computer": "💻",
-        "ai": "🧠",
-        "india": "🇮🇳",
-        "physics": "🧲",
-        "chemistry": "⚗️",
-        "biology": "🧬",
-        "history": "📜",
-        "math": "📐",
-        "music": "🎵",
-        "climate": "🌍",
-        "economy": "💰",
-        "literature": "📚",
-        "language": "🗣️"
-    }
-
-    # --- Choose emoji based on topic ---
-    bullet = get_topic_emoji(topic)
-
-
-    url = f"https://{lang}.wikipedia.org/w/api.php"
-    params = {
-        "action": "parse",
-        "page": topic,
-        "format": "json",
-        "prop": "text",
-        "section": section_index
-    }
-
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        html = response.json()["parse"]["text"]["*"]
-        soup = bs4.BeautifulSoup(html, "html.parser")
-        text = soup.get_text()
-
-        # --- Clean up junk ---
-        text = re.sub(r"\[\d+\]", "", text)
-        text = re.sub(r"\^ Cite error.*", "", text)
-        text = re.sub(r"\n{2,}", "\n", text)
-        text = re.sub(r"\n\s+", "\n", text)
-        text = text.strip()
-
-        # --- Break long lines into bullet points ---
-        lines = text.split("\n")
-        cleaned_lines = []
-
-        important_terms = re.compile(r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)*|\d{4}|[A-Z]{2,})\b")
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if len(line) > 250:
-                subpoints = re.split(r'(?<=[.!?])\s+(?=[A-Z])', line)
-                for sp in subpoints:
-                    if len(sp.strip()) < 3:
-                        continue
-                    highlighted = important_terms.sub(r"**\1**", sp.strip())
-                    cleaned_lines.append(f"{bullet} {highlighted}")
-            else:
-                highlighted = important_terms.sub(r"**\1**", line)
-                cleaned_lines.append(f"{bullet} {highlighted}")
-
-        # Limit number of points
-        formatted = "\n\n".join(cleaned_lines[:15])
-        return formatted + "\n\n_ℹ️ Section summarized for clarity._"
-
-    except Exception as e:
-        return "❌ Error loading this section."
-
-sections = get_wikipedia_sections(topic, wiki_lang)
+    return load_article_or_empty(topic, lang).top_sections(max_level=2)
+
+def get_section_content(topic, section_index, lang="en", bullet="•", translate_to=None):
+    article = load_article(topic, lang)
+    section = article.section(section_index)
+
+    def build():
+        html = article.section_html[str(section_index)]
+        # References, edit links and citation junk are stripped while parsing
+        text = html_to_text(html)
+        translated, misses = translation.translate_document(text, translate_to, with_misses=True)
+        # Only a fully translated section is stored; partly English output isn't
+        return format_section(translated, bullet), misses == 0
+
+    # Rendered Markdown is stored per (title, section anchor, revision, lang, formatter version)
+    return section_markdown.get_or_build(
+        article.title, section["anchor"], article.revid, lang, build, translate_to, bullet
+    )
+
+
+@st.fragment
+def render_section(section, heading, lang, bullet):
+    # Content is formatted only once the section is opened, and toggling it
+    # reruns just this fragment rather than the whole page.
+    key = f"section_open_{topic}_{lang}_{section['index']}"
+    if st.toggle(f"🔹 {heading}", key=key):
+        with st.container(border=True):
+            # Failures are shown but never stored, so reopening the section retries
+            try:
+                st.markdown(get_section_content(topic, section["index"], lang, bullet, translate_to))
+            except Exception as e:
+                print(f"[Basic Info] section {section['index']} of {topic!r} failed: {e}")
+                st.markdown("❌ Error loading this section.")
+
+
+sections = get_wikipedia_sections(topic, content_lang)
 
 if sections:
-    for section in sections[:5]:  # Show only first 5 sections to keep it light
-        with st.expander(f"🔹 {section['line']}"):
-            content = get_section_content(topic, section["index"], wiki_lang)
-            st.markdown(content)
+    default_count = min(5, len(sections))  # Show only first 5 sections by default to keep it light
+    count = st.number_input("Sections to show", min_value=1, max_value=len(sections), value=default_count)
+    bullet = get_topic_emoji(topic)
+    shown = sections[:count]
+    headings = translation.translate_batch([s["line"] for s in shown], translate_to)
+    for section, heading in zip(shown, headings):
+        render_section(section, heading, content_lang, bullet)
 else:
     st.info("No detailed sections found for this topic.")
 
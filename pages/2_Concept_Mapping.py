@@ -1,15 +1,16 @@
+import time
 import streamlit as st
-from pyvis.network import Network
-import tempfile
-import os
-import networkx as nx
 import streamlit.components.v1 as components
 from topic_map import generate_topic_timeline
+import event_store
+from graph_render import LAYOUTS, SERVER_LAYOUT_MIN_NODES, concept_graph, concept_graph_html, network_html
+import graph_store
+from concept_crawler import DEADLINE, crawl
 import streamlit_timeline
 import json
-import wikipediaapi
-from nltk.corpus import stopwords
-from nltk.tokenize import RegexpTokenizer
+from article import load_article_or_empty
+from keywords import top_keywords
+import translation
 from utils import render_footer
 
 # ----------------------------- Validate Session -----------------------------
@@ -25,57 +26,98 @@ st.caption(f"🌐 Language: {language}")
 st.markdown("---")
 
 # ----------------------------- Wikipedia Summary ---------------------------
-def get_wikipedia_summary(topic):
-    wiki = wikipediaapi.Wikipedia(language='en', user_agent='wikiverse-bot/1.0')
-    page = wiki.page(topic)
-    return page.summary if page.exists() else "No summary found."
+def get_wikipedia_summary(topic, lang="en"):
+    article = load_article_or_empty(topic, lang)
+    return article.summary if article.exists and article.summary else "No summary found."
 
-summary = get_wikipedia_summary(root_topic)
+# Summary and keywords come from the chosen language's Wikipedia when it has the
+# article; links are still crawled on English Wikipedia, keyed on the topic
+wiki_lang = translation.LANG_CODES.get(language, "en")
+summary_lang = wiki_lang if wiki_lang == "en" or load_article_or_empty(root_topic, wiki_lang).exists else "en"
+
+summary = get_wikipedia_summary(root_topic, summary_lang)
 st.subheader("🔎 Quick Summary")
 st.info(summary)
 
 # ----------------------------- Keyword Extraction ---------------------------
-tokenizer = RegexpTokenizer(r'\w+')
-
-def extract_keywords(text):
-    words = tokenizer.tokenize(text)
-    stop_words = set(stopwords.words('english'))
-    keywords = [w.lower() for w in words if w.lower() not in stop_words]
-    return list(set(keywords))
-
-keywords = extract_keywords(summary)
+keywords = top_keywords(summary, lang=summary_lang)
+# Link ranking matches keywords against English link titles
+link_keywords = keywords if summary_lang == "en" else top_keywords(get_wikipedia_summary(root_topic))
 
 # ----------------------------- Concept Map Graph ----------------------------
 st.subheader("🧠 Concept Graph")
 
-graph = nx.Graph()
-graph.add_node(root_topic, size=30, title=root_topic)
-
-for kw in keywords:
-    graph.add_node(kw, size=10, title=kw)
-    graph.add_edge(root_topic, kw)
+REDRAW_INTERVAL = 1.0  # seconds between partial redraws while crawling
 
-net = Network(height="500px", width="100%", bgcolor="#222222", font_color="white")
-net.from_nx(graph)
+depth = st.slider("Link hops", min_value=0, max_value=2, value=2,
+                  help="How far to follow Wikipedia links out from the topic")
 
-with tempfile.NamedTemporaryFile(delete=False, suffix=".html") as tmp_file:
-    net.save_graph(tmp_file.name)
-    html_path = tmp_file.name
+# Filled in once the crawl has settled how many nodes the graph has
+layout_slot = st.empty()
 
-with open(html_path, 'r', encoding='utf-8') as f:
-    graph_html = f.read()
-
-components.html(graph_html, height=550)
+keyword_nodes = tuple(keywords)
+graph_slot = st.empty()
+links = graph_store.get_store()
+if depth == 0:
+    edges = []
+elif links.has_neighbourhood(root_topic, depth):
+    # Explored before (by anyone): no upstream calls at all
+    edges = links.neighbourhood(root_topic, depth)
+else:
+    # Draw the partial graph as link batches come in
+    edges, started = [], time.monotonic()
+    last_draw = started
+    with st.spinner("🔗 Following links..."):
+        for edge in crawl(root_topic, depth=depth, keywords=link_keywords):
+            edges.append(edge)
+            if time.monotonic() - last_draw >= REDRAW_INTERVAL:
+                with graph_slot:
+                    components.html(network_html(concept_graph(root_topic, keyword_nodes, edges)), height=550)
+                last_draw = time.monotonic()
+    if edges and time.monotonic() - started < DEADLINE:
+        links.record_crawl(root_topic, depth, edges)
+
+# Big graphs get a server-side layout so the browser doesn't run physics on them
+node_count = len({root_topic, *keyword_nodes} | {n for source, target, _ in edges for n in (source, target)})
+layout_options = ["Browser physics"] + [name.replace("_", "-").title() for name in LAYOUTS]
+default_layout = 1 if LAYOUTS and node_count >= SERVER_LAYOUT_MIN_NODES else 0
+with layout_slot:
+    layout_choice = st.selectbox("Layout", layout_options, index=default_layout,
+                                 help=f"{node_count} nodes")
+layout = None if layout_choice == "Browser physics" else LAYOUTS[layout_options.index(layout_choice) - 1]
+
+with graph_slot:
+    components.html(concept_graph_html(root_topic, keyword_nodes, tuple(edges), layout=layout), height=550)
+linked_topics = sorted({target for _, target, _ in edges})
 
 # ----------------------------- Timeline -------------------------------------
 st.subheader("📅 Timeline")
 
-timeline_data = generate_topic_timeline(root_topic)
+try:
+    timeline_data = generate_topic_timeline(root_topic)
+except Exception as e:
+    print(f"[Concept Mapping] timeline for {root_topic!r} failed: {e}")
+    timeline_data = [{"start_date": {"year": 2000}, "text": {"headline": "Error", "text": str(e)}}]
 
 if timeline_data:
     streamlit_timeline.timeline(json.dumps({"events": timeline_data}), height=600)
 else:
     st.info("❌ No timeline data could be extracted for this topic.")
 
+# ----------------------------- Related Timeline -----------------------------
+# Every explored topic lands in the event store, so related topics that have
+# been visited before can share one timeline without any extraction here.
+with st.expander("🕰️ Events across related topics"):
+    store = event_store.get_store()
+    related = [root_topic] + link_keywords + linked_topics
+    start_year, end_year = st.slider("Years", min_value=-3000, max_value=2030, value=(1900, 1950), step=10)
+    related_events = store.events_between(start_year, end_year, topics=related)
+    if related_events:
+        found = sorted({e["group"] for e in related_events})
+        st.caption(f"{len(related_events)} events from: {', '.join(found)}")
+        streamlit_timeline.timeline(json.dumps({"events": related_events}), height=500)
+    else:
+        st.info("No stored events in this range for this topic or its related concepts yet.")
+
 # ----------------------------- Footer ---------------------------------------
 render_footer()
\ No newline at end of file
@@ -1,5 +1,4 @@
 import streamlit as st
-import requests
 from urllib.parse import quote_plus
 from utils import render_footer, render_chatbot
 
@@ -1,11 +1,11 @@
 
 # ✅ Ensure a topic is selected
 import streamlit as st
-import requests
 import json
 from urllib.parse import quote_plus
 from utils import render_footer
-from streamlit_extras.stylable_container import stylable_container
+import http_cache
+import http_client
 
 
 st.set_page_config(page_title="👥 Contributors", layout="wide")
@@ -24,7 +24,7 @@ st.markdown(f"Showing key contributors related to **{topic}**.")
 def get_contributor_names(topic):
     try:
         prompt = f"List 5 people who made major contributions to the topic '{topic}', such as scientists, inventors, researchers, or pioneers. Respond with just a plain list of names."
-        response = requests.post(
+        response = http_client.post(
             "https://api-inference.huggingface.co/models/google/flan-t5-large",
             headers={"Authorization": f"Bearer YOUR_HUGGINGFACE_API_KEY"},
             json={"inputs": prompt},
@@ -39,7 +39,7 @@ def get_contributor_names(topic):
 def get_person_info(name, lang="en"):
     try:
         url = f"https://{lang}.wikipedia.org/api/rest_v1/page/summary/{quote_plus(name)}"
-        r = requests.get(url).json()
+        r = http_cache.get_json(url)
         return {
             "title": r.get("title", name),
             "summary": r.get("extract", "No description available."),
@@ -54,6 +54,8 @@ contributor_names = get_contributor_names(topic)
 if not contributor_names:
     st.info("No contributors found.")
 else:
+    from streamlit_extras.stylable_container import stylable_container
+
     st.markdown("---")
     for name in contributor_names:
         info = get_person_info(name)
@@ -1,6 +1,6 @@
 import streamlit as st
-import requests
 from urllib.parse import quote_plus
+from books import fetch_books
 from utils import render_footer
 
 st.set_page_config(page_title="📚 Book Shelf", layout="wide")
@@ -8,23 +8,11 @@ st.title("📚 Explore Books Related to Your Topic")
 
 query = st.session_state.get("selected_topic", "Artificial Intelligence")
 
-def fetch_books(query):
-    url = f"https://www.googleapis.com/books/v1/volumes?q={quote_plus(query)}"
-    try:
-        r = requests.get(url, timeout=5)
-        r.raise_for_status()
-        books = r.json().get("items", [])[:10]
-        return [{
-            "title": b["volumeInfo"].get("title", "No title"),
-            "authors": b["volumeInfo"].get("authors", []),
-            "desc": b["volumeInfo"].get("description", "No description."),
-            "thumbnail": b["volumeInfo"].get("imageLinks", {}).get("thumbnail", ""),
-            "preview": b["volumeInfo"].get("previewLink", "")
-        } for b in books]
-    except:
-        return []
-
-books = fetch_books(query)
+try:
+    books = fetch_books(query)
+except Exception as e:
+    print(f"[Books] lookup for {query!r} failed: {e}")
+    books = []
 
 if not books:
     st.warning("No books found for this topic.")
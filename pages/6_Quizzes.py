@@ -1,7 +1,7 @@
 import streamlit as st
 import random
-import requests
-from utils import render_footer
+from article import load_article_or_empty
+from utils import render_footer, t_batch
 
 st.set_page_config(page_title="🧠 Quiz & Advanced", layout="wide")
 
@@ -17,15 +17,8 @@ difficulty_map = {"Easy": 3, "Medium": 5, "Hard": 7}
 num_questions = difficulty_map[difficulty]
 
 # 🧠 Fetch Wikipedia Summary
-@st.cache_data(show_spinner=False)
 def fetch_summary(topic):
-    try:
-        url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{topic.replace(' ', '_')}"
-        r = requests.get(url, timeout=5)
-        r.raise_for_status()
-        return r.json().get("extract", "")
-    except:
-        return ""
+    return load_article_or_empty(topic).summary
 
 summary_text = fetch_summary(topic)
 
@@ -87,10 +80,15 @@ if not questions:
     st.error("⚠️ Could not generate questions. Try another topic.")
     st.stop()
 
+# Questions and options are translated for display only; answers are still checked in English
+question_labels = t_batch([q["question"] for q in questions])
+all_options = list(dict.fromkeys(o for q in questions for o in q["options"]))
+option_labels = dict(zip(all_options, t_batch(all_options)))
+
 # 🎯 Quiz Form
 with st.form("quiz_form"):
-    for q in questions:
-        user_answers[q["id"]] = st.radio(f"**{q['question']}**", options=q["options"], key=f"{q['id']}_{difficulty}")
+    for q, label in zip(questions, question_labels):
+        user_answers[q["id"]] = st.radio(f"**{label}**", options=q["options"], format_func=lambda o: option_labels.get(o, o), key=f"{q['id']}_{difficulty}")
     submitted = st.form_submit_button("Submit Answers")
 
 if submitted:
@@ -1,7 +1,6 @@
 import streamlit as st
-import requests
-from urllib.parse import quote_plus
-from utils import render_footer
+from careers import fetch_career_related_content
+from utils import render_footer, t_batch, t_document
 
 st.set_page_config(page_title="💼 Careers & Jobs", layout="wide")
 st.title("💼 Career Opportunities")
@@ -14,33 +13,6 @@ if "selected_topic" not in st.session_state:
 topic = st.session_state["selected_topic"]
 st.success(f"Showing careers for: **{topic}**")
 
-# ✅ Wikipedia Extractor (Summary + Content)
-@st.cache_data(show_spinner=False)
-def fetch_career_related_content(query):
-    summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{quote_plus(query)}"
-    content_url = f"https://en.wikipedia.org/api/rest_v1/page/mobile-sections/{quote_plus(query)}"
-
-    summary, content = "", ""
-
-    try:
-        s_resp = requests.get(summary_url, timeout=4)
-        if s_resp.status_code == 200:
-            summary = s_resp.json().get("extract", "")
-    except:
-        pass
-
-    try:
-        c_resp = requests.get(content_url, timeout=6)
-        if c_resp.status_code == 200:
-            all_sections = c_resp.json().get("sections", [])
-            for section in all_sections:
-                if "career" in section.get("line", "").lower() or "application" in section.get("line", "").lower():
-                    content += section.get("text", "")
-    except:
-        pass
-
-    return summary, content
-
 # ✅ Filter relevant lines
 def extract_career_lines(text):
     lines = text.replace('\n', '. ').split('. ')
@@ -48,20 +20,24 @@ def extract_career_lines(text):
     return list(set(career_lines))
 
 # ✅ Get info
-summary_text, content_text = fetch_career_related_content(topic)
+try:
+    summary_text, content_text = fetch_career_related_content(topic)
+except Exception as e:
+    print(f"[Careers] content unavailable for {topic!r}: {e}")
+    summary_text, content_text = "", ""
 career_lines = extract_career_lines(summary_text + " " + content_text)
 
 # ✅ Display
 st.markdown("### 📘 Overview")
 if summary_text:
-    st.info(summary_text)
+    st.info(t_document(summary_text))
 else:
     st.warning("No summary available.")
 
 st.markdown("### 💼 Career/Job Insights")
 
 if career_lines:
-    for line in career_lines:
+    for line in t_batch(career_lines):
         st.markdown(f"- 🔹 {line}")
 else:
     fallback = {
@@ -0,0 +1,58 @@
+# prefetch.py
+# Warm every page's data in the background as soon as a topic is submitted, so
+# switching pages renders from cache instead of starting fetches cold.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from article import load_article
+from books import fetch_books
+from careers import fetch_career_related_content
+from topic_map import generate_topic_timeline
+from utils import get_topic_emoji
+
+_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="prefetch")
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def _run(name, fn, *args):
+    try:
+        fn(*args)
+    except Exception as e:
+        print(f"[Prefetch] {name} failed for {args!r}: {e}")
+
+
+def prefetch_topic(topic, lang="en"):
+    """Start background fetches for `topic`; returns immediately.
+
+    Repeated calls while a prefetch for the same (topic, lang) is running are
+    ignored. Every job fills the same caches the pages read from.
+    """
+    key = (topic, lang)
+    with _pending_lock:
+        for done_key in [k for k, fs in _pending.items() if all(f.done() for f in fs)]:
+            del _pending[done_key]
+        if key in _pending:
+            return _pending[key]
+
+        futures = [
+            _executor.submit(_run, "books", fetch_books, topic),
+            _executor.submit(_warm_article_data, topic, lang),
+        ]
+        _pending[key] = futures
+    return futures
+
+
+def _warm_article_data(topic, lang):
+    # The article carries the summary, sections and categories. Load it first
+    # so the jobs derived from it read it from cache instead of racing to fetch it.
+    if lang != "en":
+        _executor.submit(_run, "article", load_article, topic, lang)
+    _run("article", load_article, topic, "en")
+
+    for name, fn in (
+        ("timeline", generate_topic_timeline),
+        ("careers", fetch_career_related_content),
+        ("emoji", get_topic_emoji),
+    ):
+        _run(name, fn, topic)
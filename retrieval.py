@@ -0,0 +1,101 @@
+# retrieval.py
+# Small in-process BM25 index over an article's section text, used to ground
+# chatbot prompts in what the user is actually reading.
+import math
+import re
+from collections import Counter
+
+import streamlit as st
+
+from article import load_article
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+CHUNK_WORDS = 120
+
+
+def tokenize(text):
+    return [w.lower() for w in TOKEN_RE.findall(text)]
+
+
+def estimate_tokens(text):
+    # ~4/3 model tokens per word is close enough for budgeting English prose
+    return int(len(text.split()) * 4 / 3) + 1
+
+
+def chunk_article(article, chunk_words=CHUNK_WORDS):
+    """Split the article into ~`chunk_words`-word passages tagged with their heading.
+
+    Only the lead and top-level sections are walked, since a section's HTML
+    already contains its subsections.
+    """
+    headings = {"0": "Introduction"}
+    headings.update({str(s["index"]): s["line"] for s in article.top_sections(max_level=1)})
+
+    chunks = []
+    for index, heading in headings.items():
+        words = article.section_text(index).split()
+        for start in range(0, len(words), chunk_words):
+            passage = " ".join(words[start:start + chunk_words])
+            if passage:
+                chunks.append({"section": heading, "text": passage})
+    return chunks
+
+
+class BM25Index:
+    def __init__(self, chunks, k1=1.5, b=0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokenize(c["section"] + " " + c["text"])) for c in chunks]
+        self.lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+
+        doc_freq = Counter()
+        for tf in self.term_freqs:
+            doc_freq.update(tf.keys())
+        n = len(chunks)
+        self.idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+
+    def search(self, query, k=4):
+        terms = [t for t in set(tokenize(query)) if t in self.idf]
+        if not terms:
+            return []
+
+        scored = []
+        for i, tf in enumerate(self.term_freqs):
+            norm = self.k1 * (1 - self.b + self.b * self.lengths[i] / self.avg_length)
+            score = sum(
+                self.idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm)
+                for t in terms if t in tf
+            )
+            if score > 0:
+                scored.append((score, i))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [self.chunks[i] for _, i in scored[:k]]
+
+
+@st.cache_resource(show_spinner=False, ttl=3600)
+def get_article_index(title, lang="en"):
+    return BM25Index(chunk_article(load_article(title, lang)))
+
+
+def build_context(title, question, k=4, token_budget=600, lang="en"):
+    """Top-k passages for `question`, concatenated until `token_budget` is spent."""
+    try:
+        passages = get_article_index(title, lang).search(question, k=k)
+    except Exception as e:
+        print(f"[Retrieval] index failed for {title!r}: {e}")
+        return ""
+
+    parts, used = [], 0
+    for passage in passages:
+        line = f"[{passage['section']}] {passage['text']}"
+        cost = estimate_tokens(line)
+        if used + cost > token_budget:
+            remaining_words = int((token_budget - used) * 3 / 4)
+            if remaining_words > 20:
+                parts.append(" ".join(line.split()[:remaining_words]) + " …")
+            break
+        parts.append(line)
+        used += cost
+    return "\n".join(parts)
@@ -0,0 +1,86 @@
+# section_markdown.py
+# Formatter that turns section text into the bullet-point Markdown shown on the
+# Basic Info page, plus a persistent store of its output.
+#
+# Artifacts are keyed on (title, section anchor, revision, lang, ...,
+# FORMATTER_VERSION). An edit to the article gives it a new revision, so a
+# section added or removed upstream never serves another section's text. Bump
+# the version whenever format_section's output changes and only the old
+# formatter's artifacts stop matching (they then age out of the LRU store).
+import json
+import os
+import re
+import threading
+
+from http_cache import CACHE_DIR, Store
+
+FORMATTER_VERSION = 1
+ARTIFACT_PATH = os.path.join(CACHE_DIR, "artifacts.sqlite3")
+ARTIFACT_TTL = 30 * 24 * 60 * 60
+ARTIFACT_MAX_BYTES = 64 * 1024 * 1024
+MAX_POINTS = 15
+
+IMPORTANT_TERMS_RE = re.compile(r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)*|\d{4}|[A-Z]{2,})\b")
+SUBPOINT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = Store(ARTIFACT_PATH, table="section_markdown", max_bytes=ARTIFACT_MAX_BYTES)
+    return _store
+
+
+def format_section(text, bullet="•", max_points=MAX_POINTS):
+    # --- Break long lines into bullet points ---
+    cleaned_lines = []
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) > 250:
+            for sp in SUBPOINT_SPLIT_RE.split(line):
+                if len(sp.strip()) < 3:
+                    continue
+                highlighted = IMPORTANT_TERMS_RE.sub(r"**\1**", sp.strip())
+                cleaned_lines.append(f"{bullet} {highlighted}")
+        else:
+            highlighted = IMPORTANT_TERMS_RE.sub(r"**\1**", line)
+            cleaned_lines.append(f"{bullet} {highlighted}")
+
+    # Limit number of points
+    formatted = "\n\n".join(cleaned_lines[:max_points])
+    return formatted + "\n\n_ℹ️ Section summarized for clarity._"
+
+
+def artifact_key(title, anchor, revid, lang, translate_to=None, bullet="•"):
+    return json.dumps(
+        [title, anchor, revid, lang, translate_to, bullet, FORMATTER_VERSION], ensure_ascii=False
+    )
+
+
+def get_or_build(title, anchor, revid, lang, build, translate_to=None, bullet="•"):
+    """Stored Markdown for this section, or the Markdown from `build()`.
+
+    `title` should be the canonical article title and `revid` the revision the
+    section came from; without a revision nothing is stored. `build()` returns
+    (markdown, cacheable); degraded output such as a failed translation should
+    come back with cacheable=False so it isn't persisted.
+    """
+    if revid is None:
+        return build()[0]
+    store = get_store()
+    key = artifact_key(title, anchor, revid, lang, translate_to, bullet)
+    cached = store.get(key)
+    if cached is not None and cached[2]:
+        return cached[0].decode("utf-8")
+
+    markdown, cacheable = build()
+    if cacheable:
+        store.put(key, markdown.encode("utf-8"), ARTIFACT_TTL)
+    return markdown
@@ -0,0 +1,50 @@
+# singleflight.py
+# Collapse identical concurrent calls into one: the first caller for a key does
+# the work, everyone else arriving while it runs waits for and shares its result.
+import threading
+from concurrent.futures import Future
+
+_groups = {}
+
+
+class Group:
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executed": 0, "collapsed": 0}
+        _groups[name] = self
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            self._stats["calls"] += 1
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats["executed"] += 1
+            else:
+                self._stats["collapsed"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+
+def stats():
+    return {name: group.stats() for name, group in _groups.items()}
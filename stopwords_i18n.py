@@ -0,0 +1,68 @@
+# stopwords_i18n.py
+# Built-in stopwords for every UI language and a Unicode-aware tokenizer.
+#
+# Plain frozensets in code, so keyword extraction never reads a corpus from
+# disk and works the same whether or not NLTK data is installed.
+import re
+
+# Python's \w doesn't match Indic vowel signs and viramas (categories Mc/Mn),
+# which would cut "भारत" or "తెలుగు" into fragments. Devanagari..Malayalam are
+# added explicitly, along with ZWNJ/ZWJ used inside Indic words; digits,
+# underscores and the danda (।, ॥) still end a token.
+TOKEN_RE = re.compile(r"(?:(?![\d_\u0964\u0965])[\w\u0900-\u0D7F\u200C\u200D])+")
+
+EN = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours yourself yourselves
+he him his himself she she's her hers herself it it's its itself they them their theirs themselves
+what which who whom this that that'll these those am is are was were be been being have has had
+having do does did doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down in out on off over
+under again further then once here there when where why how all any both each few more most other
+some such no nor not only own same so than too very s t can will just don don't should should've
+now d ll m o re ve y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't shan shan't shouldn
+shouldn't wasn wasn't weren weren't won won't wouldn wouldn't
+also may one two would could many known used among within since well however
+""".split())
+
+HI = frozenset("""
+अंदर अत अपना अपनी अपने अभी आदि आप इत्यादि इन इनका इन्हीं इन्हें इन्हों इस इसका इसकी इसके इसमें इसी इसे
+उन उनका उनकी उनके उनको उन्हीं उन्हें उन्हों उस उसके उसी उसे एक एवं एस ऐसे और कई कर करता करते करना
+करने करें कहते कहा का काफ़ी कि कितना किन्हें किन्हों किया किर किस किसी किसे की कुछ कुल के को कोई कौन
+कौनसा गया घर जब जहाँ जा जितना जिन जिन्हें जिन्हों जिस जिसे जीधर जैसा जैसे जो तक तब तरह तिन तिन्हें
+तिन्हों तिस तिसे तो था थी थे दबारा दिया दुसरा दूसरे दो द्वारा न नके नहीं ना निहायत नीचे ने पर पहले पूरा
+पे फिर बनी बही बहुत बाद बाला बिलकुल भी भीतर मगर मानो मे में यदि यह यहाँ यही या यिह ये रखें रहा रहे
+ऱ्वासा लिए लिये लेकिन व वग़ैरह वर्ग वह वहाँ वहीं वाले वुह वे सकता सकते सबसे सभी साथ साबुत साभ सारा
+से सो संग ही हुआ हुई हुए है हैं हो होता होती होते होना होने
+""".split())
+
+TE = frozenset("""
+అందరూ అందుకు అందులో అక్కడ అతను అది అదే అని అనే అన్ని అప్పుడు అయితే అయిన అయినా అలా అవి ఆ ఆమె ఇక
+ఇక్కడ ఇది ఇదే ఇప్పుడు ఇవి ఈ ఉంది ఉండే ఉన్న ఉన్నాయి ఉన్నారు ఎందుకు ఎక్కడ ఎప్పుడు ఎవరు ఏ ఏమి ఒక
+ఒకటి కాదు కాని కానీ కూడా కొన్ని కోసం గా గురించి చాలా చేసిన తన తర్వాత తరువాత తో దాని దీని నుండి
+నుంచి పై మరియు మరి మీద మేము లేదా లేదు లో వారి వారు వంటి వద్ద వల్ల విధంగా వీరు సమయంలో అనేక
+""".split())
+
+TA = frozenset("""
+அந்த அது அதன் அதை அதில் அவர் அவர்கள் அவள் அவன் அல்லது அனைத்து ஆகிய ஆகும் ஆனால் இந்த இது இதன்
+இதை இதில் இருந்த இருந்து இருக்கும் இல்லை இவர் இவை உள்ள உள்ளது உள்ளன என்ற என்று என்பது என்ன எந்த
+எனவே ஒரு ஒன்று கொண்ட கொண்டு சில தனது தான் பல பிற போது போன்ற மட்டும் மற்றும் மீது மேலும் முதல்
+வரை வந்த வேண்டும் ஆக ஆகியோர் இருப்பினும் என்றும் ஏனெனில் மிக
+""".split())
+
+KN = frozenset("""
+ಅದು ಅದರ ಅದನ್ನು ಅಥವಾ ಅನೇಕ ಅಲ್ಲ ಅಲ್ಲಿ ಅವನು ಅವರ ಅವರು ಅವಳು ಅವು ಆ ಆಗ ಆದರೆ ಆದ್ದರಿಂದ ಇದು ಇದರ ಇದನ್ನು
+ಇಲ್ಲ ಇಲ್ಲಿ ಇವರು ಇವು ಈ ಇದೆ ಇದ್ದ ಇರುವ ಉಳ್ಳ ಎಂದು ಎಂಬ ಎಲ್ಲ ಎಲ್ಲಾ ಏಕೆ ಒಂದು ಕೆಲವು ಗೆ ನಂತರ ಮತ್ತು ಮತ್ತೆ
+ಮೇಲೆ ಮೊದಲು ಯಾವ ಯಾರು ವರೆಗೆ ಸಹ ಹಾಗೂ ಹಾಗೆ ಹೆಚ್ಚು ಕೂಡ ಬಗ್ಗೆ ಮೂಲಕ ಕುರಿತು ಅಂತ
+""".split())
+
+STOP_WORDS = {"en": EN, "hi": HI, "te": TE, "ta": TA, "kn": KN}
+
+
+def stop_words(lang="en"):
+    """Stopwords for a Wikipedia language code; unknown languages get English."""
+    return STOP_WORDS.get(lang, EN)
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text)
@@ -0,0 +1,67 @@
+# Tests run against the flat root modules with every on-disk cache in a temp dir.
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ.setdefault("WIKITRAIL_CACHE_DIR", tempfile.mkdtemp(prefix="wikitrail-test-"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    """Answers /api/generate like Ollama: chunked NDJSON when streaming, one object otherwise."""
+    protocol_version = "HTTP/1.1"
+    tokens = ["Hello", " from", " the", " stub", "."]
+    token_delay = 0.05
+    requests = []
+    clients = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubOllama.requests.append(body)
+        StubOllama.clients.append(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        if not body["stream"]:
+            time.sleep(0.3)
+            reply = json.dumps({"response": "".join(self.tokens), "done": True}).encode()
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+            return
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for token in self.tokens:
+                self._chunk(json.dumps({"response": token, "done": False}).encode() + b"\n")
+                time.sleep(self.token_delay)
+            self._chunk(json.dumps({"response": "", "done": True}).encode() + b"\n")
+            self._chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    import utils
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StubOllama.requests = []
+    StubOllama.clients = []
+    monkeypatch.setattr(utils, "OLLAMA_URL", f"http://127.0.0.1:{server.server_port}/api/generate")
+    yield StubOllama
+    server.shutdown()
+    server.server_close()
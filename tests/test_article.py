@@ -0,0 +1,74 @@
+# Section splitting and the uncached fallback when Wikipedia is unreachable.
+import pytest
+
+import article
+from article import split_sections
+
+PAGE_HTML = (
+    '<p>Lead text.</p>'
+    '<div class="mw-heading mw-heading2"><h2 id="Contents">Contents</h2></div><ul><li>toc</li></ul>'
+    '<div class="mw-heading mw-heading2"><h2 id="History">History</h2></div><p>History text.</p>'
+    '<div class="mw-heading mw-heading3"><h3 id="Early_period">Early period</h3></div><p>Early text.</p>'
+    '<h2><span class="mw-headline" id="Geography">Geography</span></h2><p>Geography text.</p>'
+    '<h3><span class="mw-headline" id="Rivers">Rivers</span></h3><p>Rivers text.</p>'
+    "<h2 id='Economy'>Economy</h2><p>Economy text.</p>"
+)
+SECTIONS = [
+    {"index": "1", "anchor": "History", "line": "History", "toclevel": 1},
+    {"index": "2", "anchor": "Early_period", "line": "Early period", "toclevel": 2},
+    {"index": "3", "anchor": "Geography", "line": "Geography", "toclevel": 1},
+    {"index": "4", "anchor": "Rivers", "line": "Rivers", "toclevel": 2},
+    {"index": "5", "anchor": "Economy", "line": "Economy", "toclevel": 1},
+]
+
+
+def test_sections_matched_by_anchor_in_both_markups():
+    chunks = split_sections(PAGE_HTML, SECTIONS)
+    assert sorted(chunks) == ["0", "1", "2", "3", "4", "5"]
+    assert "Lead text." in chunks["0"] and "toc" not in chunks["0"]
+    # The unmatched "Contents" heading doesn't shift later sections
+    assert all("toc" not in chunk for chunk in chunks.values())
+    assert "History text." in chunks["1"] and "Early text." in chunks["1"]
+    assert "Geography text." not in chunks["1"]
+    assert "Early text." in chunks["2"] and "History text." not in chunks["2"]
+    assert "Geography text." in chunks["3"] and "Rivers text." in chunks["3"]
+    assert "Economy text." not in chunks["3"]
+    assert "Rivers text." in chunks["4"] and "Geography text." not in chunks["4"]
+    assert "Economy text." in chunks["5"]
+
+
+@pytest.fixture
+def wikipedia_down(monkeypatch):
+    def unreachable(url, params=None, timeout=10):
+        raise ConnectionError("Wikipedia unreachable")
+    monkeypatch.setattr(article, "_get_json", unreachable)
+    return monkeypatch
+
+
+def test_fetch_article_raises_when_both_calls_fail(wikipedia_down):
+    with pytest.raises(ConnectionError):
+        article.fetch_article("Anything")
+
+
+def test_fetch_article_keeps_partial_results(monkeypatch):
+    def summary_only(url, params=None, timeout=10):
+        if params:
+            raise ConnectionError("parse failed")
+        return {"title": "India", "extract": "A country."}
+    monkeypatch.setattr(article, "_get_json", summary_only)
+    result = article.fetch_article("india")
+    assert result.exists and result.title == "India" and result.summary == "A country."
+
+
+def test_unreachable_article_is_not_cached(wikipedia_down):
+    title = "Cache Probe Topic"
+    empty = article.load_article_or_empty(title)
+    assert not empty.exists
+
+    def online(url, params=None, timeout=10):
+        if params:
+            return {"parse": {"revid": 7, "text": "<p>Lead.</p>", "sections": [], "categories": []}}
+        return {"title": title, "extract": "Back online."}
+    wikipedia_down.setattr(article, "_get_json", online)
+    loaded = article.load_article_or_empty(title)
+    assert loaded.exists and loaded.summary == "Back online." and loaded.revid == 7
@@ -0,0 +1,15 @@
+# The concept graph component must render without fetching anything remote.
+import re
+
+import pytest
+
+pytest.importorskip("pyvis")
+pytest.importorskip("networkx")
+
+from graph_render import concept_graph, network_html
+
+
+def test_network_html_has_no_remote_resources():
+    html = network_html(concept_graph("India", ("Delhi", "Mumbai"), [("India", "Asia", 1)]))
+    assert "vis.Network" in html
+    assert re.findall(r'(?:src|href)=["\']https?://', html) == []
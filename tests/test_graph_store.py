@@ -0,0 +1,53 @@
+# Shared concept-graph store: one node per title, and deep crawls never shrink stored maps.
+import pytest
+
+from graph_store import GraphStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return GraphStore(str(tmp_path / "graph.sqlite3"))
+
+
+def components(edges):
+    parent = {}
+
+    def find(node):
+        while parent.setdefault(node, node) != node:
+            node = parent[node]
+        return node
+
+    for source, target, _hop in edges:
+        parent[find(source)] = find(target)
+    return {find(node) for node in list(parent)}
+
+
+def test_map_crawled_under_other_casing_is_one_component(store):
+    store.record_crawl("india", 1, [("india", "Delhi", 1), ("india", "Mumbai", 1)])
+    store.record_crawl("delhi", 1, [("delhi", "Red Fort", 1), ("delhi", "india", 1)])
+
+    edges = store.neighbourhood("India", 2)
+    nodes = {n for source, target, _ in edges for n in (source, target)}
+    assert nodes == {"India", "Delhi", "Mumbai", "Red Fort"}
+    assert len(components(edges)) == 1
+    assert store.has_neighbourhood("India", 1)
+
+
+def test_deep_crawl_keeps_links_stored_by_the_sources_own_crawl(store):
+    b_links = [f"B{i}" for i in range(30)]
+    store.record_crawl("B", 1, [("B", t, 1) for t in b_links])
+
+    # A's depth-2 crawl only kept B's top 6 links, one of them new
+    kept = b_links[:5] + ["B-new"]
+    store.record_crawl("A", 2, [("A", "B", 1)] + [("B", t, 2) for t in kept])
+
+    b_targets = {t for _, t, _ in store.neighbourhood("B", 1)}
+    assert b_targets == set(b_links) | {"B-new"}
+
+
+def test_recrawl_replaces_only_the_roots_edges(store):
+    store.record_crawl("A", 2, [("A", "Old", 1), ("Old", "Deep", 2)])
+    store.record_crawl("A", 2, [("A", "New", 1)])
+
+    assert {t for _, t, _ in store.neighbourhood("A", 1)} == {"New"}
+    assert {t for _, t, _ in store.neighbourhood("Old", 1)} == {"Deep"}
@@ -0,0 +1,114 @@
+# TTL, revalidation, stale-on-error and LRU eviction against a stub HTTP server.
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_cache
+
+
+class StubWiki(BaseHTTPRequestHandler):
+    """Serves {"version": N} with an ETag; answers 304 when the client already has it."""
+    protocol_version = "HTTP/1.1"
+    version = 1
+    failing = False
+    requests = []
+
+    def do_GET(self):
+        StubWiki.requests.append(dict(self.headers))
+        if self.failing:
+            self._reply(500, b"{}")
+            return
+        etag = f'"v{self.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._reply(304, b"", etag)
+            return
+        self._reply(200, json.dumps({"version": self.version}).encode(), etag)
+
+    def _reply(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def wiki():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWiki)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StubWiki.version, StubWiki.failing, StubWiki.requests = 1, False, []
+    yield StubWiki, f"http://127.0.0.1:{server.server_port}/page/{time.time()}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fresh_entry_served_without_network(wiki):
+    stub, url = wiki
+    assert http_cache.get_json(url, ttl=60) == {"version": 1}
+    stub.version = 2
+    assert http_cache.get_json(url, ttl=60) == {"version": 1}
+    assert len(stub.requests) == 1
+
+
+def test_expired_entry_revalidated_with_304(wiki):
+    stub, url = wiki
+    http_cache.get_json(url, ttl=0.1)
+    time.sleep(0.2)
+    revalidated = http_cache.stats()["revalidated"]
+    assert http_cache.get_json(url, ttl=60) == {"version": 1}
+    assert stub.requests[1]["If-None-Match"] == '"v1"'
+    assert stub.requests[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert http_cache.stats()["revalidated"] == revalidated + 1
+    # The 304 renewed the TTL
+    http_cache.get_json(url, ttl=60)
+    assert len(stub.requests) == 2
+
+
+def test_expired_entry_replaced_when_upstream_changed(wiki):
+    stub, url = wiki
+    http_cache.get_json(url, ttl=0.1)
+    time.sleep(0.2)
+    stub.version = 2
+    assert http_cache.get_json(url, ttl=60) == {"version": 2}
+    assert http_cache.get_json(url, ttl=60) == {"version": 2}
+    assert len(stub.requests) == 2
+
+
+def test_stale_entry_served_when_upstream_fails(wiki):
+    stub, url = wiki
+    http_cache.get_json(url, ttl=0.1)
+    time.sleep(0.2)
+    stub.failing = True
+    stale_served = http_cache.stats()["stale_served"]
+    assert http_cache.get_json(url, ttl=60) == {"version": 1}
+    assert http_cache.stats()["stale_served"] == stale_served + 1
+
+
+def test_error_without_cached_copy_raises_and_caches_nothing(wiki):
+    stub, url = wiki
+    stub.failing = True
+    with pytest.raises(Exception):
+        http_cache.get_json(url, ttl=60)
+    assert http_cache.get_store().get(http_cache.cache_key(url)) is None
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = http_cache.Store(str(tmp_path / "lru.sqlite3"), max_bytes=30)
+    for key in ("a", "b", "c"):
+        store.put(key, b"x" * 10, ttl=60)
+        time.sleep(0.01)
+    store.get("a")
+    time.sleep(0.01)
+    store.put("d", b"x" * 10, ttl=60)
+    assert store.get("b") is None
+    assert all(store.get(key) is not None for key in ("a", "c", "d"))
+    assert store.total_bytes() == 30
@@ -0,0 +1,38 @@
+# Completion cache in front of the stub Ollama server.
+import threading
+import time
+
+import llm_cache
+import utils
+
+
+def test_streamed_answer_is_cached_and_served_whole(ollama):
+    prompt = f"cached stream {time.time()}"
+    assert list(utils.stream_chatbot(prompt)) == ollama.tokens
+    assert list(utils.stream_chatbot(prompt)) == ["".join(ollama.tokens)]
+    assert len(ollama.requests) == 1
+
+
+def test_query_is_cached_and_use_cache_false_skips_it(ollama):
+    prompt = f"cached query {time.time()}"
+    assert utils.query_chatbot(prompt) == "".join(ollama.tokens)
+    # Whitespace differences hit the same entry
+    assert utils.query_chatbot(f"  {prompt}\n") == "".join(ollama.tokens)
+    assert len(ollama.requests) == 1
+    utils.query_chatbot(prompt, use_cache=False)
+    assert len(ollama.requests) == 2
+
+
+def test_options_are_part_of_the_key(ollama):
+    prompt = f"options {time.time()}"
+    utils.query_chatbot(prompt, options={"num_predict": 16})
+    utils.query_chatbot(prompt, options={"num_predict": 32})
+    assert len(ollama.requests) == 2
+
+
+def test_cancelled_stream_is_not_cached(ollama):
+    prompt = f"cancelled {time.time()}"
+    cancel = threading.Event()
+    for _ in utils.stream_chatbot(prompt, cancel_event=cancel):
+        cancel.set()
+    assert llm_cache.get(utils.OLLAMA_MODEL, prompt) is None
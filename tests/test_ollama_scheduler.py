@@ -0,0 +1,82 @@
+# Admission control in front of Ollama.
+import threading
+import time
+
+import pytest
+
+import utils
+
+
+def test_scheduler_serves_interactive_before_background():
+    scheduler = utils.OllamaScheduler(max_in_flight=1, max_queue=8, queue_timeout=5)
+    order = []
+
+    def run(name, priority):
+        with scheduler.slot(name, priority):
+            order.append(name)
+
+    with scheduler.slot("holder"):
+        threads = [threading.Thread(target=run, args=("background", utils.PRIORITY_BACKGROUND))]
+        threads[0].start()
+        time.sleep(0.1)
+        threads.append(threading.Thread(target=run, args=("interactive", utils.PRIORITY_INTERACTIVE)))
+        threads[1].start()
+        time.sleep(0.1)
+    for t in threads:
+        t.join()
+    assert order == ["interactive", "background"]
+
+
+def run_in_slot(scheduler, session_id):
+    with scheduler.slot(session_id):
+        pass
+
+
+def test_scheduler_rejects_when_full_or_timed_out():
+    scheduler = utils.OllamaScheduler(max_in_flight=1, max_queue=1, queue_timeout=1)
+    with scheduler.slot("a"):
+        waiter = threading.Thread(target=run_in_slot, args=(scheduler, "b"))
+        waiter.start()
+        time.sleep(0.1)
+        with pytest.raises(utils.SchedulerBusy, match="queue full"):
+            with scheduler.slot("c"):
+                pass
+    waiter.join()
+    assert scheduler.metrics()["rejected"] == 1
+
+    scheduler = utils.OllamaScheduler(max_in_flight=1, max_queue=4, queue_timeout=0.1)
+    with scheduler.slot("a"):
+        with pytest.raises(utils.SchedulerBusy, match="timed out"):
+            with scheduler.slot("b"):
+                pass
+    metrics = scheduler.metrics()
+    assert metrics["timed_out"] == 1 and metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+
+
+def test_busy_scheduler_answers_busy_instead_of_hanging(ollama, monkeypatch):
+    scheduler = utils.OllamaScheduler(max_in_flight=1, max_queue=4, queue_timeout=0.1)
+    monkeypatch.setattr(utils, "ollama_scheduler", scheduler)
+    with scheduler.slot("someone else"):
+        assert list(utils.stream_chatbot(f"busy {time.time()}", use_cache=False)) == [utils.OLLAMA_BUSY_MESSAGE]
+        assert utils.query_chatbot(f"busy {time.time()}", use_cache=False) == utils.OLLAMA_BUSY_MESSAGE
+    assert ollama.requests == []
+
+
+def test_scheduler_alternates_between_sessions():
+    scheduler = utils.OllamaScheduler(max_in_flight=1, max_queue=8, queue_timeout=5)
+    order = []
+
+    def run(name):
+        with scheduler.slot(name):
+            order.append(name)
+
+    threads = []
+    with scheduler.slot("holder"):
+        # One session queues three requests before another session queues one
+        for name in ("busy", "busy", "busy", "other"):
+            threads.append(threading.Thread(target=run, args=(name,)))
+            threads[-1].start()
+            time.sleep(0.05)
+    for t in threads:
+        t.join()
+    assert order == ["busy", "other", "busy", "busy"]
@@ -0,0 +1,43 @@
+# Token streaming and cancellation against the stub Ollama server.
+import threading
+import time
+
+import utils
+
+
+def test_stream_yields_tokens_as_they_arrive(ollama):
+    timings = {}
+    arrivals = []
+    for token in utils.stream_chatbot(f"stream {time.time()}", timings=timings, use_cache=False):
+        arrivals.append((token, time.perf_counter()))
+    assert [token for token, _ in arrivals] == ollama.tokens
+    # The first token is handed over before the rest of the reply is generated
+    assert arrivals[-1][1] - arrivals[0][1] >= ollama.token_delay * (len(ollama.tokens) - 2)
+    assert 0 < timings["ttft"] < ollama.token_delay * len(ollama.tokens)
+    assert ollama.requests[0]["stream"] is True
+
+
+def test_cancel_stops_stream_and_frees_the_slot(ollama):
+    cancel = threading.Event()
+    cancelled_before = utils.ollama_metrics()["cancelled"]
+    received = []
+    for token in utils.stream_chatbot(f"cancel {time.time()}", cancel_event=cancel, use_cache=False):
+        received.append(token)
+        cancel.set()
+    assert received == ollama.tokens[:1]
+    assert utils.ollama_metrics()["cancelled"] == cancelled_before + 1
+    assert utils.ollama_scheduler.metrics()["in_flight"] == 0
+
+
+def test_closing_the_generator_counts_as_cancelled(ollama):
+    cancelled_before = utils.ollama_metrics()["cancelled"]
+    stream = utils.stream_chatbot(f"close {time.time()}", use_cache=False)
+    assert next(stream) == ollama.tokens[0]
+    stream.close()
+    assert utils.ollama_metrics()["cancelled"] == cancelled_before + 1
+
+
+def test_consecutive_streams_reuse_the_connection(ollama):
+    for i in range(2):
+        assert list(utils.stream_chatbot(f"reuse {i} {time.time()}", use_cache=False)) == ollama.tokens
+    assert len(ollama.clients) == 2 and ollama.clients[0] == ollama.clients[1]
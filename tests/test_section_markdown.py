@@ -0,0 +1,28 @@
+# Stored section Markdown must follow the article's revision and section anchors.
+import section_markdown
+
+
+def builder(markdown, calls):
+    def build():
+        calls.append(markdown)
+        return markdown, True
+    return build
+
+
+def test_artifact_reused_only_for_same_revision_and_anchor():
+    calls = []
+    get = section_markdown.get_or_build
+    assert get("Test Page", "History", 100, "en", builder("old history", calls)) == "old history"
+    assert get("Test Page", "History", 100, "en", builder("unused", calls)) == "old history"
+    # A new revision or another section's anchor never reuses the stored text
+    assert get("Test Page", "History", 101, "en", builder("new history", calls)) == "new history"
+    assert get("Test Page", "Geography", 101, "en", builder("geography", calls)) == "geography"
+    assert calls == ["old history", "new history", "geography"]
+
+
+def test_nothing_stored_without_revision():
+    calls = []
+    get = section_markdown.get_or_build
+    get("No Revision", "Lead", None, "en", builder("first", calls))
+    assert get("No Revision", "Lead", None, "en", builder("second", calls)) == "second"
+    assert calls == ["first", "second"]
@@ -0,0 +1,87 @@
+# Identical concurrent calls share one execution, for Ollama and for HTTP fetches.
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_cache
+import singleflight
+import utils
+
+
+def run_concurrently(fn, n=4):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fn())) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_identical_queries_share_one_generation(ollama):
+    prompt = f"singleflight {time.time()}"
+    answers = run_concurrently(lambda: utils.query_chatbot(prompt, use_cache=False))
+    assert answers == ["".join(ollama.tokens)] * 4
+    assert len(ollama.requests) == 1
+
+
+class SlowJson(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = 0
+
+    def do_GET(self):
+        SlowJson.requests += 1
+        time.sleep(0.3)
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_concurrent_cache_misses_share_one_fetch():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowJson)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/slow/{time.time()}"
+    try:
+        assert run_concurrently(lambda: http_cache.get_json(url, ttl=60)) == [{"ok": True}] * 4
+        assert SlowJson.requests == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_followers_share_the_leaders_exception_and_key_is_released():
+    group = singleflight.Group("test")
+    started = threading.Event()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("upstream down")
+
+    def call():
+        try:
+            return group.do("key", fail)
+        except ValueError as e:
+            return str(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    assert run_concurrently(call, n=3) == ["upstream down"] * 3
+    leader.join()
+    assert len(calls) == 1
+    assert group.stats() == {"calls": 4, "executed": 1, "collapsed": 3, "in_flight": 0}
+    # The failure isn't remembered: the next call runs again
+    with pytest.raises(ValueError):
+        group.do("key", fail)
+    assert len(calls) == 2
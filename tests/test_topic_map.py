@@ -0,0 +1,39 @@
+# Date parsing and event extraction for topic timelines.
+import pytest
+
+from topic_map import DATE_RE, _parse_date, extract_events
+
+
+def parse(text):
+    return _parse_date(DATE_RE.search(text))
+
+
+@pytest.mark.parametrize("text, start, end", [
+    ("1 September 1939", {"year": 1939, "month": 9, "day": 1}, None),
+    ("September 1, 1939", {"year": 1939, "month": 9, "day": 1}, None),
+    ("May 1945", {"year": 1945, "month": 5}, None),
+    ("c. 3300–1300 BC", {"year": -3300}, {"year": -1300}),
+    ("AD 43", {"year": 43}, None),
+    ("1939–45", {"year": 1939}, {"year": 1945}),
+    ("1914 to 1918", {"year": 1914}, {"year": 1918}),
+    ("between 1914 and 1918", {"year": 1914}, {"year": 1918}),
+    ("Between 1947 and 1950", {"year": 1947}, {"year": 1950}),
+])
+def test_parse_date(text, start, end):
+    assert parse(text) == (start, end)
+
+
+def test_and_without_between_is_not_a_range():
+    assert parse("1914 and 1918") == ({"year": 1914}, None)
+
+
+def test_extract_events_reads_ranges_and_rejects_counts():
+    events = extract_events(
+        "The First World War was fought between 1914 and 1918 across Europe. "
+        "About 1,500 soldiers were lost in the opening battle. "
+        "The Romans invaded Britain in AD 43 under Claudius."
+    )
+    assert [(e["start_date"], e.get("end_date"), e["text"]["headline"]) for e in events] == [
+        ({"year": 1914}, {"year": 1918}, "1914–1918"),
+        ({"year": 43}, None, "AD 43"),
+    ]
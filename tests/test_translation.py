@@ -0,0 +1,40 @@
+# UI-string translation: catalog, dedupe, persistent cache and its TTL.
+import time
+
+import pytest
+
+import translation
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    batches = []
+
+    def fake_request(texts, lang_code):
+        batches.append(list(texts))
+        return [f"[{lang_code}] {t}" for t in texts]
+    monkeypatch.setattr(translation, "_request_batch", fake_request)
+    return batches
+
+
+def test_catalog_strings_never_go_upstream(upstream):
+    assert translation.translate_batch(translation.UI_STRINGS, "hi") == [
+        translation.CATALOG["hi"][s] for s in translation.UI_STRINGS
+    ]
+    assert upstream == []
+
+
+def test_duplicates_sent_once_and_then_cached(upstream):
+    text = f"Hello {time.time()}"
+    assert translation.translate_batch([text, text], "te") == [f"[te] {text}"] * 2
+    assert translation.translate_batch([text], "te") == [f"[te] {text}"]
+    assert upstream == [[text]]
+
+
+def test_expired_translation_is_redone(upstream, monkeypatch):
+    monkeypatch.setattr(translation, "TRANSLATION_TTL", 0.1)
+    text = f"Short lived {time.time()}"
+    translation.translate_batch([text], "ta")
+    time.sleep(0.2)
+    translation.translate_batch([text], "ta")
+    assert upstream == [[text], [text]]
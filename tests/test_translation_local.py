@@ -0,0 +1,37 @@
+# The local translation pool with a tiny stand-in model in place of IndicTrans2.
+import time
+
+import pytest
+
+from translation_local import LocalTranslator
+
+
+def upper_model(model_name, num_threads, max_length, batch_size):
+    def translate(texts, tgt):
+        return [f"{tgt}:{t.upper()}" for t in texts]
+    return translate
+
+
+def broken_model(model_name, num_threads, max_length, batch_size):
+    raise ImportError("no torch here")
+
+
+def test_pool_translates_with_stand_in_model():
+    translator = LocalTranslator(num_workers=2, loader=upper_model)
+    try:
+        assert translator.translate(["one", "two"], "hi", timeout=30) == ["hin_Deva:ONE", "hin_Deva:TWO"]
+        futures = [translator.submit([f"s{i}"], "te") for i in range(8)]
+        assert [f.result(timeout=30) for f in futures] == [[f"tel_Telu:S{i}"] for i in range(8)]
+        with pytest.raises(ValueError):
+            translator.translate(["x"], "fr")
+    finally:
+        translator.close()
+
+
+def test_workers_that_fail_to_load_fail_fast():
+    translator = LocalTranslator(num_workers=1, loader=broken_model)
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="no torch here"):
+        translator.translate(["one"], "hi", timeout=60)
+    assert time.monotonic() - started < 30
+    assert not translator.alive()
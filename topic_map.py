@@ -1,78 +1,172 @@
 import re
-import json
-import requests
-from bs4 import BeautifulSoup
+import streamlit as st
 
-import re
-import requests
+import event_store
+from article import load_article
+
+MAX_EVENTS = 100
+NEAR_DUPLICATE_JACCARD = 0.8
+
+# Sections that cite dates without describing events
+SKIP_SECTIONS = ("references", "notes", "see also", "external links", "further reading",
+                 "bibliography", "sources", "citations", "footnotes")
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+MONTH_NUMBERS = {m: i for i, m in enumerate(MONTHS, 1)}
+_MONTH = "|".join(MONTHS)
+
+# Sentence breaks, except after abbreviations common around dates ("c. 1500")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])(?<!\bc\.)(?<!\bca\.)(?<!\bSt\.)(?<!\be\.g\.)(?<!\bi\.e\.)\s+|\n+")
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+# One pass finds every date form we care about:
+#   "1 September 1939", "September 1, 1939", "May 1945", "c. 3300 BCE",
+#   "AD 43", "1939–1945", "1939-45", "1914 to 1918", "3300–1300 BC",
+#   "between 1914 and 1918" ("and" only joins a range after "between")
+DATE_RE = re.compile(rf"""
+    (?=[\dJFMASONDAcBb])  # cheap first-character filter before the alternations
+    (?P<between>[Bb]etween\s+)?
+    (?:(?P<day>\d{{1,2}})\s+(?P<month>{_MONTH})\s+
+      |(?P<month_first>{_MONTH})\s+(?:(?P<day_second>\d{{1,2}}),\s+)?)?
+    (?:(?:c\.|ca\.|circa)\s*)?
+    (?P<ad>AD\s+)?
+    (?<![\d.,])(?P<year>\d{{1,4}})(?![\d]|[.,]\d)
+    (?:\s*(?:–|—|-|to|until|(?(between)and|(?!)))\s*(?P<end>\d{{1,4}})(?![\d]|[.,]\d))?
+    (?:\s*(?P<era>BCE|BC|CE|AD)\b)?
+""", re.VERBOSE)
+
+
+def _parse_date(match):
+    """(start, end) dicts in TimelineJS shape, or None if this isn't a usable date."""
+    year = int(match.group("year"))
+    end = int(match.group("end")) if match.group("end") else None
+    era = match.group("era")
+    month_name = match.group("month") or match.group("month_first")
+    day = match.group("day") or match.group("day_second")
+
+    if era is None and not match.group("ad"):
+        # Bare numbers only count as years in the 1000–2099 range
+        if not 1000 <= year <= 2099:
+            return None
+    elif year == 0:
+        return None
+
+    if end is not None:
+        if era is None and end < 100 <= year:
+            end = year // 100 * 100 + end  # "1939–45"
+        if era in ("BC", "BCE"):
+            if end >= year:
+                end = None
+        elif end <= year or (era is None and end > 2099):
+            end = None
+
+    sign = -1 if era in ("BC", "BCE") else 1
+    start = {"year": sign * year}
+    if month_name:
+        start["month"] = MONTH_NUMBERS[month_name]
+        if day and 1 <= int(day) <= 31:
+            start["day"] = int(day)
+    end_date = {"year": sign * end} if end is not None else None
+    return start, end_date
+
+
+def _headline(start, end_date):
+    def label(date):
+        year = date["year"]
+        if year < 0:
+            return f"{-year} BC"
+        return f"AD {year}" if year < 1000 else str(year)
+
+    if end_date:
+        return f"{label(start)}–{label(end_date)}"
+    if "month" in start:
+        prefix = f"{start['day']} " if "day" in start else ""
+        return f"{prefix}{MONTHS[start['month'] - 1]} {label(start)}"
+    return label(start)
 
+
+def extract_events(text):
+    """Timeline events for every sentence in `text` that carries a date."""
+    events = []
+    for sentence in SENTENCE_SPLIT_RE.split(text):
+        sentence = sentence.strip()
+        if len(sentence) < 15:
+            continue
+        for match in DATE_RE.finditer(sentence):
+            parsed = _parse_date(match)
+            if parsed is None:
+                continue
+            start, end_date = parsed
+            event = {
+                "start_date": start,
+                "text": {"headline": _headline(start, end_date), "text": sentence},
+            }
+            if end_date:
+                event["end_date"] = end_date
+            events.append(event)
+            break
+    return events
+
+
+def _signature(event):
+    return set(WORD_RE.findall(event["text"]["text"].lower()))
+
+
+def dedupe_events(events, threshold=NEAR_DUPLICATE_JACCARD):
+    """Drop events whose wording nearly matches an earlier event in the same year."""
+    kept, seen_by_year = [], {}
+    for event in events:
+        words = _signature(event)
+        seen = seen_by_year.setdefault(event["start_date"]["year"], [])
+        if any(len(words & other) / max(1, len(words | other)) >= threshold for other in seen):
+            continue
+        seen.append(words)
+        kept.append(event)
+    return kept
+
+
+def _sort_key(event):
+    start = event["start_date"]
+    return start["year"], start.get("month", 0), start.get("day", 0)
+
+
+def timeline_from_article(article, max_events=MAX_EVENTS):
+    # Top-level sections already contain their subsections, so walking the lead
+    # and level-1 sections covers the article once. History-like sections go
+    # first so they win when the event cap is hit.
+    sections = [s for s in article.top_sections(max_level=1)
+                if not any(skip in s["line"].lower() for skip in SKIP_SECTIONS)]
+    sections.sort(key=lambda s: "history" not in s["line"].lower())
+
+    events = extract_events(article.section_text("0"))
+    for section in sections:
+        events.extend(extract_events(article.section_text(section["index"])))
+
+    events = dedupe_events(events)[:max_events]
+    events.sort(key=_sort_key)
+    return events
+
+
+# Failures propagate instead of being returned, so an outage isn't cached for an hour
+@st.cache_data(ttl=3600, show_spinner=False)
 def generate_topic_timeline(topic):
-    url = "https://en.wikipedia.org/w/api.php"
-    params = {
-        "action": "parse",
-        "page": topic,
-        "format": "json",
-        "prop": "sections"
-    }
-
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        sections = data["parse"]["sections"]
-        
-        # Find 'History' or similar section
-        history_section_index = None
-        for section in sections:
-            if "history" in section["line"].lower():
-                history_section_index = section["index"]
-                break
-
-        if history_section_index is None:
+    store = event_store.get_store()
+    timeline = store.events_for(topic)
+    if timeline is None:
+        article = load_article(topic)
+        if not article.exists or not article.sections:
             return [{"start_date": {"year": 2000}, "text": {"headline": "No Timeline", "text": "No historical data found."}}]
 
-        # Now get content of the History section
-        content_params = {
-            "action": "parse",
-            "page": topic,
-            "format": "json",
-            "prop": "text",
-            "section": history_section_index
-        }
-
-        content_response = requests.get(url, params=content_params)
-        content_response.raise_for_status()
-        html = content_response.json()["parse"]["text"]["*"]
-
-        import bs4
-        soup = bs4.BeautifulSoup(html, "html.parser")
-        text = soup.get_text()
-
-        # Extract year-based sentences
-        sentences = text.split(". ")
-        timeline = []
-
-        for sentence in sentences:
-            years = re.findall(r"(1[0-9]{3}|20[0-9]{2})", sentence)
-            if years:
-                year = int(years[0])
-                timeline.append({
-                    "start_date": {"year": year},
-                    "text": {
-                        "headline": f"{year}",
-                        "text": sentence.strip()
-                    }
-                })
-
-        if not timeline:
-            timeline.append({
-                "start_date": {"year": 2000},
-                "text": {"headline": "No Events Found", "text": "No clear events could be parsed from Wikipedia."}
-            })
-
-        # Sort by year
-        timeline.sort(key=lambda x: x["start_date"]["year"])
-        return timeline
-
-    except Exception as e:
-        return [{"start_date": {"year": 2000}, "text": {"headline": "Error", "text": str(e)}}]
+        # Stored under the canonical (post-redirect) title
+        timeline = store.events_for(article.title)
+        if timeline is None:
+            timeline = timeline_from_article(article)
+            store.record(article.title, timeline)
+
+    if not timeline:
+        timeline.append({
+            "start_date": {"year": 2000},
+            "text": {"headline": "No Events Found", "text": "No clear events could be parsed from Wikipedia."}
+        })
+    return timeline
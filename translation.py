@@ -0,0 +1,229 @@
+# translation.py
+# English -> Indic translation for UI strings and article text.
+#
+# Lookups go shipped catalog -> in-process memo -> on-disk cache, and whatever
+# is still missing is sent to IndicTrans2 as one deduplicated batch per language.
+import functools
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+import streamlit as st
+
+import http_client
+from http_cache import CACHE_DIR, Store
+
+INDICTRANS_API = "https://api-inference.huggingface.co/models/ai4bharat/indictrans2-en-indic"
+
+LANG_CODES = {
+    "English": "en",
+    "Hindi": "hi",
+    "Telugu": "te",
+    "Tamil": "ta",
+    "Kannada": "kn"
+}
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales", "ui_strings.json")
+TRANSLATION_CACHE_PATH = os.path.join(CACHE_DIR, "translations.sqlite3")
+TRANSLATION_TTL = 90 * 24 * 60 * 60
+BATCH_SIZE = 32
+BATCH_TOKEN_BUDGET = 1024
+
+# Splits after sentence punctuation or at line breaks, keeping the separator so
+# translated documents can be stitched back together with their layout intact
+SEGMENT_RE = re.compile(r"((?<=[.!?।])[ \t]+|\s*\n\s*)")
+
+# "remote" = Hugging Face Inference API, "local" = on-box model (translation_local)
+BACKEND = os.environ.get("WIKITRAIL_TRANSLATION_BACKEND", "remote")
+
+# Static Homepage labels compiled into the catalog by `python translation.py compile-catalog`
+UI_STRINGS = [
+    "🌐 WikiVerse Pro",
+    "Explore. Learn. Connect.",
+    "Choose language for results",
+    "🔍 Search Wikipedia Topic",
+    "e.g., Quantum Computing",
+]
+
+
+def _load_catalog():
+    try:
+        with open(CATALOG_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[Translation] catalog not loaded: {e}")
+        return {}
+
+
+CATALOG = _load_catalog()
+
+_memo = {}
+_memo_lock = threading.Lock()
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = Store(TRANSLATION_CACHE_PATH, table="translations")
+    return _store
+
+
+def _key(text, lang_code):
+    return f"{lang_code}\x1f{text}"
+
+
+def lookup(text, lang_code):
+    """Translation of `text` if it is already known locally, else None."""
+    catalog_hit = CATALOG.get(lang_code, {}).get(text)
+    if catalog_hit is not None:
+        return catalog_hit
+
+    key = _key(text, lang_code)
+    with _memo_lock:
+        memo = _memo.get(key)
+    if memo is not None and memo[1] > time.time():
+        return memo[0]
+
+    cached = get_store().get(key)
+    # Past TRANSLATION_TTL the stored translation is redone, so upstream fixes reach us
+    if cached is None or not cached[2]:
+        return None
+    translated = cached[0].decode("utf-8")
+    with _memo_lock:
+        _memo[key] = (translated, cached[1].get("expires_at", 0))
+    return translated
+
+
+def remember(text, lang_code, translated):
+    key = _key(text, lang_code)
+    expires_at = time.time() + TRANSLATION_TTL
+    with _memo_lock:
+        _memo[key] = (translated, expires_at)
+    get_store().put(key, translated.encode("utf-8"), TRANSLATION_TTL, meta={"expires_at": expires_at})
+
+
+@functools.lru_cache(maxsize=None)
+def hf_token():
+    # Read on first remote call, not at import: locating and parsing the
+    # secrets file is the slowest part of importing this module
+    return st.secrets.get("HF_TOKEN")
+
+
+def _request_batch(texts, lang_code):
+    if BACKEND == "local":
+        import translation_local
+        return translation_local.get_translator().translate(texts, lang_code)
+
+    payload = {
+        "inputs": texts,
+        "parameters": {
+            "src_lang": "en",
+            "tgt_lang": lang_code
+        }
+    }
+    headers = {
+        "Authorization": f"Bearer {hf_token()}"
+    }
+    response = http_client.post(INDICTRANS_API, json=payload, headers=headers, timeout=(3.05, 30))
+    response.raise_for_status()
+    results = response.json()
+    if len(results) != len(texts):
+        raise ValueError(f"expected {len(texts)} translations, got {len(results)}")
+    return [r["translation_text"] for r in results]
+
+
+def estimate_tokens(text):
+    return int(len(text.split()) * 4 / 3) + 1
+
+
+def _batches(texts, max_items=BATCH_SIZE, token_budget=BATCH_TOKEN_BUDGET):
+    batch, used = [], 0
+    for text in texts:
+        cost = estimate_tokens(text)
+        if batch and (len(batch) >= max_items or used + cost > token_budget):
+            yield batch
+            batch, used = [], 0
+        batch.append(text)
+        used += cost
+    if batch:
+        yield batch
+
+
+def translate_batch(texts, lang_code, with_misses=False):
+    """Translate a list of English strings, returning them in the same order.
+
+    Duplicates and already-known strings are never sent upstream; on failure
+    the untranslated English text is returned for the missing entries. With
+    `with_misses=True` the result is (translations, number left untranslated),
+    so callers can avoid persisting partly-English output.
+    """
+    if lang_code in (None, "en"):
+        return (list(texts), 0) if with_misses else list(texts)
+
+    results = {}
+    missing = []
+    for text in dict.fromkeys(texts):
+        translated = lookup(text, lang_code) if text.strip() else text
+        if translated is None:
+            missing.append(text)
+        else:
+            results[text] = translated
+
+    for chunk in _batches(missing):
+        try:
+            for text, translated in zip(chunk, _request_batch(chunk, lang_code)):
+                remember(text, lang_code, translated)
+                results[text] = translated
+        except Exception as e:
+            print(f"[Translation Error] {e}")
+
+    translations = [results.get(text, text) for text in texts]
+    if with_misses:
+        return translations, sum(text not in results for text in texts)
+    return translations
+
+
+def translate_document(text, lang_code, with_misses=False):
+    """Translate long text sentence by sentence, preserving order and line breaks.
+
+    Sentences seen before (boilerplate, repeated phrases) come from the caches,
+    so only new sentences are sent upstream. `with_misses` works as in
+    translate_batch, counting untranslated sentences.
+    """
+    if lang_code in (None, "en") or not text.strip():
+        return (text, 0) if with_misses else text
+    pieces = SEGMENT_RE.split(text)
+    sentences = pieces[0::2]
+    translated, misses = translate_batch([s for s in sentences if s.strip()], lang_code, with_misses=True)
+    lookup_table = dict(zip([s for s in sentences if s.strip()], translated))
+    pieces[0::2] = [lookup_table.get(s, s) for s in sentences]
+    document = "".join(pieces)
+    return (document, misses) if with_misses else document
+
+
+def compile_catalog(strings=UI_STRINGS, path=CATALOG_PATH):
+    catalog = dict(CATALOG)
+    for lang_code in LANG_CODES.values():
+        if lang_code == "en":
+            continue
+        translated = translate_batch(strings, lang_code)
+        catalog.setdefault(lang_code, {}).update(
+            {src: dst for src, dst in zip(strings, translated) if src != dst}
+        )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["compile-catalog"]:
+        compile_catalog()
+    else:
+        print("usage: python translation.py compile-catalog")
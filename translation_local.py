@@ -0,0 +1,213 @@
+# translation_local.py
+# Optional on-box IndicTrans2 backend. The model is loaded once inside long-lived
+# worker processes, so translation latency depends on our CPU rather than on a
+# shared public inference endpoint. Enable with WIKITRAIL_TRANSLATION_BACKEND=local
+# after `pip install -r requirements-local-translation.txt`.
+import itertools
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+
+MODEL_NAME = os.environ.get("WIKITRAIL_INDICTRANS_MODEL", "ai4bharat/indictrans2-en-indic-dist-200M")
+NUM_WORKERS = int(os.environ.get("WIKITRAIL_TRANSLATION_WORKERS", 1))
+MAX_LENGTH = int(os.environ.get("WIKITRAIL_TRANSLATION_MAX_LENGTH", 256))
+BATCH_SIZE = int(os.environ.get("WIKITRAIL_TRANSLATION_BATCH_SIZE", 16))
+REQUEST_TIMEOUT = 120
+# How often a waiting caller checks that the workers are still alive
+LIVENESS_INTERVAL = 0.5
+
+# IndicTrans2 uses FLORES-200 language tags
+FLORES_CODES = {
+    "en": "eng_Latn",
+    "hi": "hin_Deva",
+    "te": "tel_Telu",
+    "ta": "tam_Taml",
+    "kn": "kan_Knda",
+}
+
+
+def _load_processor():
+    try:
+        from IndicTransToolkit.processor import IndicProcessor
+    except ImportError:
+        try:
+            from IndicTransToolkit import IndicProcessor
+        except ImportError:
+            return None
+    return IndicProcessor(inference=True)
+
+
+def _translate_sentences(model, tokenizer, processor, texts, tgt, max_length, batch_size):
+    import torch
+
+    src = FLORES_CODES["en"]
+    if processor is not None:
+        prepared = processor.preprocess_batch(texts, src_lang=src, tgt_lang=tgt)
+    else:
+        prepared = list(texts)
+
+    # Sort by length so each batch pads only to its own longest sentence
+    order = sorted(range(len(prepared)), key=lambda i: len(prepared[i]))
+    outputs = [None] * len(prepared)
+    for start in range(0, len(order), batch_size):
+        ids = order[start:start + batch_size]
+        batch = tokenizer(
+            [prepared[i] for i in ids],
+            padding="longest",
+            truncation=True,
+            max_length=max_length,
+            return_tensors="pt",
+        )
+        with torch.inference_mode():
+            generated = model.generate(**batch, max_length=max_length, num_beams=1)
+        decoded = tokenizer.batch_decode(generated, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+        if processor is not None:
+            decoded = processor.postprocess_batch(decoded, lang=tgt)
+        for i, text in zip(ids, decoded):
+            outputs[i] = text
+    return outputs
+
+
+def load_model(model_name, num_threads, max_length, batch_size):
+    """Load IndicTrans2 in the worker; returns translate(texts, flores_tgt) -> list."""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    torch.set_num_threads(num_threads)
+    tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=True)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, trust_remote_code=True).eval()
+    processor = _load_processor()
+
+    def translate(texts, tgt):
+        return _translate_sentences(model, tokenizer, processor, texts, tgt, max_length, batch_size)
+    return translate
+
+
+def _worker_main(loader, model_name, num_threads, jobs, results, max_length, batch_size):
+    # A worker that can't load (missing torch, bad model name) says so and
+    # exits, instead of leaving callers waiting out the full request timeout
+    try:
+        translate = loader(model_name, num_threads, max_length, batch_size)
+    except BaseException as e:
+        results.put(("failed", None, repr(e)))
+        return
+    results.put(("ready", None, None))
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, texts, lang_code = job
+        try:
+            results.put((job_id, translate(texts, FLORES_CODES[lang_code]), None))
+        except Exception as e:
+            results.put((job_id, None, repr(e)))
+
+
+class LocalTranslator:
+    """Pool of warm model workers pulling jobs from one shared queue."""
+
+    def __init__(self, model_name=MODEL_NAME, num_workers=NUM_WORKERS, max_length=MAX_LENGTH, batch_size=BATCH_SIZE,
+                 loader=load_model):
+        ctx = mp.get_context("spawn")
+        self._jobs = ctx.Queue()
+        self._results = ctx.Queue()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count()
+        self.load_error = None
+        num_threads = max(1, (os.cpu_count() or 1) // max(1, num_workers))
+        self._workers = [
+            ctx.Process(
+                target=_worker_main,
+                args=(loader, model_name, num_threads, self._jobs, self._results, max_length, batch_size),
+                daemon=True,
+            )
+            for _ in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def _collect(self):
+        while True:
+            job_id, translated, error = self._results.get()
+            if job_id == "ready":
+                continue
+            if job_id == "failed":
+                self.load_error = error
+                if not self.alive():
+                    self._fail_pending()
+                continue
+            with self._pending_lock:
+                future = self._pending.pop(job_id, None)
+            if future is None:
+                continue
+            if error:
+                future.set_exception(RuntimeError(error))
+            else:
+                future.set_result(translated)
+
+    def alive(self):
+        return any(worker.is_alive() for worker in self._workers)
+
+    def _dead_error(self):
+        codes = [worker.exitcode for worker in self._workers]
+        return RuntimeError(f"translation workers are not running (exit codes {codes}): {self.load_error}")
+
+    def _fail_pending(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(self._dead_error())
+
+    def submit(self, texts, lang_code):
+        future = Future()
+        job_id = next(self._ids)
+        with self._pending_lock:
+            self._pending[job_id] = future
+        self._jobs.put((job_id, list(texts), lang_code))
+        return future
+
+    def translate(self, texts, lang_code, timeout=REQUEST_TIMEOUT):
+        if lang_code not in FLORES_CODES:
+            raise ValueError(f"unsupported language: {lang_code}")
+        if not self.alive():
+            raise self._dead_error()
+
+        future = self.submit(texts, lang_code)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return future.result(timeout=min(LIVENESS_INTERVAL, max(0, deadline - time.monotonic())))
+            except FutureTimeout:
+                if not self.alive():
+                    # Give a just-posted load error a moment to arrive before failing
+                    time.sleep(0.05)
+                    self._fail_pending()
+                    return future.result(timeout=0)
+                if time.monotonic() >= deadline:
+                    raise
+
+    def close(self):
+        for _ in self._workers:
+            self._jobs.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+
+
+_translator = None
+_translator_lock = threading.Lock()
+
+
+def get_translator():
+    global _translator
+    if _translator is None:
+        with _translator_lock:
+            if _translator is None:
+                _translator = LocalTranslator()
+    return _translator
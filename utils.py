@@ -1,26 +1,261 @@
 # utils.py
-import requests
 import streamlit as st
 import re
+import json
+import os
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import http_client
+import llm_cache
+import singleflight
+import translation
+from article import load_article
+from retrieval import build_context
+
+OLLAMA_URL = "http://localhost:11434/api/generate"
+OLLAMA_MODEL = "llama3"  # use your pulled Ollama model here
+OLLAMA_TIMEOUT = (3.05, 120)
+OLLAMA_BUSY_MESSAGE = "🤖 WikiBot is busy helping other learners right now. Please try again in a moment."
+
+_ollama_metrics = {"streams": 0, "cancelled": 0, "ttft_samples": 0, "last_ttft": None, "total_ttft": 0.0}
+_ollama_metrics_lock = threading.Lock()
+
+
+def ollama_metrics():
+    with _ollama_metrics_lock:
+        metrics = dict(_ollama_metrics)
+    samples = metrics["ttft_samples"]
+    metrics["avg_ttft"] = metrics["total_ttft"] / samples if samples else None
+    return metrics
+
+
+def _record_ttft(seconds):
+    with _ollama_metrics_lock:
+        _ollama_metrics["ttft_samples"] += 1
+        _ollama_metrics["last_ttft"] = seconds
+        _ollama_metrics["total_ttft"] += seconds
+
+
+# === OLLAMA: Request Scheduler ===
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class SchedulerBusy(Exception):
+    pass
+
+
+class OllamaScheduler:
+    """Admission control in front of the single local Ollama instance.
+
+    At most `max_in_flight` generations run at once. Waiting requests are
+    served by priority (interactive chat before background work), then by how
+    many requests their session already has queued or running, then FIFO, so
+    one busy session cannot starve the others. When the queue is full, or a
+    request waits longer than `queue_timeout`, SchedulerBusy is raised so the
+    caller can answer "busy" instead of hanging.
+    """
+
+    def __init__(self, max_in_flight=2, max_queue=8, queue_timeout=30.0):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._per_session = defaultdict(int)
+        self._metrics = {"admitted": 0, "rejected": 0, "timed_out": 0, "max_queue_depth": 0, "total_wait": 0.0}
+
+    def metrics(self):
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics["queue_depth"] = len(self._queue)
+            metrics["in_flight"] = self._in_flight
+        metrics["avg_wait"] = metrics["total_wait"] / metrics["admitted"] if metrics["admitted"] else 0.0
+        return metrics
+
+    @contextmanager
+    def slot(self, session_id=None, priority=PRIORITY_INTERACTIVE):
+        self._acquire(session_id, priority)
+        try:
+            yield
+        finally:
+            self._release(session_id)
+
+    def _acquire(self, session_id, priority):
+        started = time.monotonic()
+        deadline = started + self.queue_timeout
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                self._metrics["rejected"] += 1
+                raise SchedulerBusy("queue full")
+
+            entry = (priority, self._per_session[session_id], next(self._seq))
+            heapq.heappush(self._queue, entry)
+            self._per_session[session_id] += 1
+            self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], len(self._queue))
+
+            while not (self._in_flight < self.max_in_flight and self._queue[0] == entry):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                    self._forget(session_id)
+                    self._metrics["timed_out"] += 1
+                    self._cond.notify_all()
+                    raise SchedulerBusy("timed out waiting for a slot")
+                self._cond.wait(remaining)
+
+            heapq.heappop(self._queue)
+            self._in_flight += 1
+            self._metrics["admitted"] += 1
+            self._metrics["total_wait"] += time.monotonic() - started
+            self._cond.notify_all()
+
+    def _release(self, session_id):
+        with self._cond:
+            self._in_flight -= 1
+            self._forget(session_id)
+            self._cond.notify_all()
+
+    def _forget(self, session_id):
+        self._per_session[session_id] -= 1
+        if self._per_session[session_id] <= 0:
+            del self._per_session[session_id]
+
+
+ollama_scheduler = OllamaScheduler(
+    max_in_flight=int(os.environ.get("OLLAMA_MAX_IN_FLIGHT", 2)),
+    max_queue=int(os.environ.get("OLLAMA_MAX_QUEUE", 8)),
+    queue_timeout=float(os.environ.get("OLLAMA_QUEUE_TIMEOUT", 30)),
+)
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else None
+    except Exception:
+        return None
+
 
 # === OLLAMA: Local Chatbot ===
-def query_chatbot(prompt):
+def _ollama_payload(prompt, options, stream):
+    payload = {"model": OLLAMA_MODEL, "prompt": prompt, "stream": stream}
+    if options:
+        payload["options"] = options
+    return payload
+
+
+def stream_chatbot(prompt, cancel_event=None, timings=None, options=None, use_cache=True,
+                   priority=PRIORITY_INTERACTIVE):
+    """Yield response tokens as Ollama streams them back.
+
+    Ollama sends one JSON object per line. Setting `cancel_event` (or closing
+    the generator) drops the connection, which also stops generation server-side.
+    If `timings` is a dict, this call's time-to-first-token is stored under "ttft".
+    Cached answers are yielded whole; pass use_cache=False to always ask the model.
+    The generation slot from `ollama_scheduler` is held until the stream ends.
+    """
+    started = time.perf_counter()
+    if use_cache:
+        cached = llm_cache.get(OLLAMA_MODEL, prompt, options)
+        if cached is not None:
+            if timings is not None:
+                timings["ttft"] = time.perf_counter() - started
+            yield cached
+            return
+
+    got_first_token = False
+    finished = False
+    tokens = []
+    with _ollama_metrics_lock:
+        _ollama_metrics["streams"] += 1
+    try:
+        with ollama_scheduler.slot(_session_id(), priority), http_client.post(
+            OLLAMA_URL,
+            json=_ollama_payload(prompt, options, stream=True),
+            timeout=OLLAMA_TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                token = chunk.get("response", "")
+                if token:
+                    if not got_first_token:
+                        got_first_token = True
+                        ttft = time.perf_counter() - started
+                        _record_ttft(ttft)
+                        if timings is not None:
+                            timings["ttft"] = ttft
+                    tokens.append(token)
+                    yield token
+                if chunk.get("done"):
+                    # No break: reading to the end of the body lets the
+                    # connection go back to the pool instead of being closed
+                    finished = True
+                    if use_cache and tokens:
+                        llm_cache.put(OLLAMA_MODEL, prompt, "".join(tokens), options)
+    except SchedulerBusy:
+        finished = True
+        yield OLLAMA_BUSY_MESSAGE
+    except Exception as e:
+        finished = True
+        yield f"Ollama Error: {str(e)}"
+    finally:
+        if not finished:
+            with _ollama_metrics_lock:
+                _ollama_metrics["cancelled"] += 1
+
+
+_ollama_flight = singleflight.Group("ollama")
+
+
+def _generate(prompt, options, priority):
+    with ollama_scheduler.slot(_session_id(), priority):
+        response = http_client.post(
+            OLLAMA_URL,
+            json=_ollama_payload(prompt, options, stream=False),
+            timeout=OLLAMA_TIMEOUT
+        )
+    response.raise_for_status()
+    return response.json().get("response")
+
+
+def query_chatbot(prompt, options=None, use_cache=True, priority=PRIORITY_INTERACTIVE):
+    if use_cache:
+        cached = llm_cache.get(OLLAMA_MODEL, prompt, options)
+        if cached is not None:
+            return cached
     try:
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={
-                "model": "llama3",  # use your pulled Ollama model here
-                "prompt": prompt,
-                "stream": False
-            }
+        # Identical prompts already being generated share that one generation
+        answer = _ollama_flight.do(
+            llm_cache.cache_key(OLLAMA_MODEL, prompt, options), _generate, prompt, options, priority
         )
-        response.raise_for_status()
-        return response.json().get("response", "No response.")
+    except SchedulerBusy:
+        return OLLAMA_BUSY_MESSAGE
     except Exception as e:
         return f"Ollama Error: {str(e)}"
+    if not answer:
+        return "No response."
+    if use_cache:
+        llm_cache.put(OLLAMA_MODEL, prompt, answer, options)
+    return answer
 
 
-def generate_advanced_info(summary):
+def generate_advanced_info(summary, use_cache=True):
     prompt = f"""
     You're an expert teacher. Expand this summary of a topic:
 
@@ -32,7 +267,7 @@ def generate_advanced_info(summary):
     - Real-world Applications
     - Background
     """
-    return query_chatbot(prompt)
+    return query_chatbot(prompt, use_cache=use_cache, priority=PRIORITY_BACKGROUND)
 
 
 def clean_bot_response(full_response, prompt):
@@ -52,113 +287,141 @@ def clean_bot_response(full_response, prompt):
     return response
 
 
+CHAT_CONTEXT_TOKENS = 600
+CHAT_OPTIONS = {"num_predict": 256}
+
+
+def build_chat_prompt(topic, question):
+    # Ground the answer in the article's own passages so the model can stay short
+    context = build_context(topic, question, token_budget=CHAT_CONTEXT_TOKENS) if topic != "this topic" else ""
+    if not context:
+        return f"You are a helpful assistant. The user is learning about '{topic}'. They ask: '{question}'"
+    return (
+        f"You are a helpful assistant. The user is learning about '{topic}'. "
+        "Answer briefly using the Wikipedia excerpts below; if they do not cover the question, say so.\n\n"
+        f"Excerpts:\n{context}\n\n"
+        f"They ask: '{question}'"
+    )
+
+
 def render_chatbot(topic="this topic"):
     if st.session_state.get("suppress_chatbot"):
         return
 
     with st.sidebar:
-        st.markdown("## 🤖 WikiBot")
-        if "chat_history" not in st.session_state:
-            st.session_state.chat_history = []
+        _chatbot_fragment(topic)
+
+
+@st.fragment
+def _chatbot_fragment(topic):
+    # Typing or pressing Send reruns only the sidebar, not the page behind it
+    st.markdown("## 🤖 WikiBot")
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = []
+
+    user_input = st.text_input("Ask anything about this topic:", key="chat_input")
+    send_col, stop_col = st.columns(2)
+    send = send_col.button("Send")
+    if stop_col.button("Stop") and "chat_cancel" in st.session_state:
+        # The click itself interrupts the running fragment; the event also
+        # stops any stream still being consumed elsewhere.
+        st.session_state.chat_cancel.set()
+
+    history = st.session_state.chat_history
+    if send and user_input:
+        prompt = build_chat_prompt(topic, user_input)
+        st.session_state.chat_cancel = threading.Event()
+        timings = {}
+        # Newest messages are shown first, so the streamed reply goes on top
+        with st.chat_message("Bot"):
+            raw_response = st.write_stream(
+                stream_chatbot(prompt, st.session_state.chat_cancel, timings, options=CHAT_OPTIONS)
+            )
+        with st.chat_message("You"):
+            st.markdown(user_input)
+        if "ttft" in timings:
+            st.caption(f"⏱ First token after {timings['ttft']:.2f}s")
+        history.append(("You", user_input))
+        history.append(("Bot", clean_bot_response(raw_response, prompt)))
+        history = history[:-2]
+
+    for role, message in reversed(history):
+        with st.chat_message(role):
+            st.markdown(message)
+
+
+CATEGORY_EMOJI_MAP = {
+    "automotive": "🚗", "vehicles": "🚗", "transport": "🚌",
+    "aircraft": "✈", "space": "🚀", "astronomy": "🌌",
+    "astronaut": "🧑‍🚀", "robotics": "🤖", "robot": "🤖",
+    "ai": "🧠", "artificial intelligence": "🧠", "computer": "💻",
+    "software": "💻", "hardware": "🖥", "biology": "🧬",
+    "genetics": "🧬", "chemistry": "⚗", "physics": "🧲",
+    "mathematics": "📐", "music": "🎵", "instrument": "🎻",
+    "film": "🎬", "movie": "🎥", "finance": "💰",
+    "banking": "🏦", "india": "🇮🇳", "country": "🌍",
+    "language": "🗣", "literature": "📚", "writer": "✍",
+    "history": "📜", "military": "🪖", "politics": "🏛",
+    "education": "🎓", "school": "🏫", "university": "🎓",
+    "engineering": "🛠"
+}
 
-        user_input = st.text_input("Ask anything about this topic:", key="chat_input")
-        if st.button("Send"):
-            if user_input:
-                prompt = f"You are a helpful assistant. The user is learning about '{topic}'. They ask: '{user_input}'"
-                raw_response = query_chatbot(prompt)
-                clean_response = clean_bot_response(raw_response, prompt)
-                st.session_state.chat_history.append(("You", user_input))
-                st.session_state.chat_history.append(("Bot", clean_response))
 
-        for role, message in reversed(st.session_state.chat_history):
-            with st.chat_message(role):
-                st.markdown(message)
+def emoji_for_categories(categories) -> str:
+    for cat in categories:
+        cat = cat.lower()
+        for keyword, emoji in CATEGORY_EMOJI_MAP.items():
+            if keyword in cat:
+                return emoji
+    return "•"
 
 
-def get_topic_emoji(topic: str) -> str:
-    category_emoji_map = {
-        "automotive": "🚗", "vehicles": "🚗", "transport": "🚌",
-        "aircraft": "✈", "space": "🚀", "astronomy": "🌌",
-        "astronaut": "🧑‍🚀", "robotics": "🤖", "robot": "🤖",
-        "ai": "🧠", "artificial intelligence": "🧠", "computer": "💻",
-        "software": "💻", "hardware": "🖥", "biology": "🧬",
-        "genetics": "🧬", "chemistry": "⚗", "physics": "🧲",
-        "mathematics": "📐", "music": "🎵", "instrument": "🎻",
-        "film": "🎬", "movie": "🎥", "finance": "💰",
-        "banking": "🏦", "india": "🇮🇳", "country": "🌍",
-        "language": "🗣", "literature": "📚", "writer": "✍",
-        "history": "📜", "military": "🪖", "politics": "🏛",
-        "education": "🎓", "school": "🏫", "university": "🎓",
-        "engineering": "🛠"
-    }
+@st.cache_data(ttl=3600, show_spinner=False)
+def _topic_emoji(topic: str) -> str:
+    # Categories come with the cached Article, so this costs no extra request
+    return emoji_for_categories(load_article(topic).categories)
 
+
+def get_topic_emoji(topic: str) -> str:
+    # Failures fall back to a bullet without being cached
     try:
-        topic_encoded = topic.replace(" ", "_")
-        url = f"https://en.wikipedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "prop": "categories",
-            "format": "json",
-            "titles": topic_encoded
-        }
-
-        r = requests.get(url, params=params, timeout=5)
-        r.raise_for_status()
-        data = r.json()
-        pages = data.get("query", {}).get("pages", {})
-        categories = []
-        for page in pages.values():
-            categories = [cat["title"].lower() for cat in page.get("categories", [])]
-
-        for cat in categories:
-            for keyword, emoji in category_emoji_map.items():
-                if keyword in cat:
-                    return emoji
+        return _topic_emoji(topic)
     except Exception as e:
         print("⚠ Emoji fetch failed:", e)
-
     return "•"
 
 
-INDICTRANS_API = "https://api-inference.huggingface.co/models/ai4bharat/indictrans2-en-indic"
-HF_TOKEN = st.secrets.get("HF_TOKEN")
+lang_code_map = translation.LANG_CODES
 
-lang_code_map = {
-    "English": "en",
-    "Hindi": "hi",
-    "Telugu": "te",
-    "Tamil": "ta",
-    "Kannada": "kn"
-}
 
-def t(text, target_lang=None):
+def _target_code(target_lang):
     lang = target_lang or st.session_state.get("language", "English")
     if lang == "English":
-        return text
+        return None
+    return lang_code_map.get(lang)
 
-    tgt_lang_code = lang_code_map.get(lang)
+
+def t_batch(texts, target_lang=None):
+    # One deduplicated upstream request per language for everything a page needs
+    tgt_lang_code = _target_code(target_lang)
     if not tgt_lang_code:
-        return text
+        return list(texts)
+    return translation.translate_batch(texts, tgt_lang_code)
+
 
-    payload = {
-        "inputs": text,
-        "parameters": {
-            "src_lang": "en",
-            "tgt_lang": tgt_lang_code
-        }
-    }
+def t(text, target_lang=None):
+    tgt_lang_code = _target_code(target_lang)
+    if not tgt_lang_code:
+        return text
+    return translation.translate_batch([text], tgt_lang_code)[0]
 
-    headers = {
-        "Authorization": f"Bearer {HF_TOKEN}"
-    }
 
-    try:
-        response = requests.post(INDICTRANS_API, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()[0]["translation_text"]
-    except Exception as e:
-        print(f"[Translation Error] {e}")
+def t_document(text, target_lang=None):
+    # Paragraph-sized text: translated per sentence, reusing every cached sentence
+    tgt_lang_code = _target_code(target_lang)
+    if not tgt_lang_code:
         return text
+    return translation.translate_document(text, tgt_lang_code)
 
 
 def render_footer():